@@ -3,24 +3,35 @@
 User Data Export Script for Disaster Recovery
 
 This script exports all user-related data from the Django SQLite database
-including users, groups, permissions, and model assignments for disaster recovery.
+including users, groups, and model assignments for disaster recovery.
 
 Usage:
-    python scripts/backup/export_user_data.py [output_file]
+    python scripts/backup/export_user_data.py [--quiet] [--include-permissions] [output_file]
 
 Arguments:
-    output_file: Optional path to output JSON file (default: user_data_backup_YYYYMMDD_HHMMSS.json)
+    output_file: Optional path to output JSON Lines file (default: user_data_backup_YYYYMMDD_HHMMSS.jsonl)
+    --quiet: Suppress progress and per-section output
+    --include-permissions: Also export the Permission table (for audit backups; not used on import)
 
 Output:
-    JSON file containing all user-related data that can be used to recreate the database.
+    JSON Lines file containing all user-related data that can be used to recreate the database.
+    The first line is a header record, followed by one {"section": ...} marker per section
+    and one record per row. Rows are written as they are read, so memory use stays flat.
 """
 
 import os
 import sys
 import json
+import argparse
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add the Django project to the path
 script_dir = Path(__file__).resolve().parent
 project_root = script_dir.parent.parent
@@ -37,50 +48,64 @@ django.setup()
 
 from django.contrib.auth.models import User, Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch
 from summarizer.home.models import SupportedOpenAIModel
 
+# Backup format version written to the header line.
+# 2: user date_joined/last_login are epoch seconds instead of ISO 8601 strings.
+SCHEMA_VERSION = 2
+
+# Rows fetched per database round-trip; .iterator() skips the queryset result
+# cache so only one chunk is held in memory at a time.
+ITERATOR_CHUNK_SIZE = 2000
+
+# Chunk size for iterator() combined with prefetch_related; each chunk's
+# prefetch query uses an IN clause of this many ids
+PREFETCH_CHUNK_SIZE = 500
+
+# Print a progress line every N rows written
+PROGRESS_INTERVAL = 1000
 
 def export_users():
     """Export all user data including passwords and metadata."""
-    users = []
-    for user in User.objects.all():
-        user_data = {
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'password': user.password,  # Already hashed
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'is_active': user.is_active,
-            'is_staff': user.is_staff,
-            'is_superuser': user.is_superuser,
-            'date_joined': user.date_joined.isoformat(),
-            'last_login': user.last_login.isoformat() if user.last_login else None,
-            'groups': list(user.groups.values_list('id', flat=True)),
-            'user_permissions': list(user.user_permissions.values_list('id', flat=True)),
-        }
-        users.append(user_data)
-    return users
+    # Fetch the M2M tables once instead of querying them per user
+    groups_by_user = defaultdict(list)
+    for user_id, group_id in User.groups.through.objects.values_list('user_id', 'group_id'):
+        groups_by_user[user_id].append(group_id)
+
+    permissions_by_user = defaultdict(list)
+    for user_id, permission_id in User.user_permissions.through.objects.values_list('user_id', 'permission_id'):
+        permissions_by_user[user_id].append(permission_id)
+
+    for user_data in User.objects.values(
+        'id', 'username', 'email',
+        'password',  # Already hashed
+        'first_name', 'last_name', 'is_active', 'is_staff', 'is_superuser',
+        'date_joined', 'last_login',
+    ).iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        # Epoch seconds (schema version 2); earlier backups used ISO 8601 strings
+        user_data['date_joined'] = int(user_data['date_joined'].timestamp())
+        user_data['last_login'] = int(user_data['last_login'].timestamp()) if user_data['last_login'] else None
+        user_data['groups'] = groups_by_user.get(user_data['id'], [])
+        user_data['user_permissions'] = permissions_by_user.get(user_data['id'], [])
+        yield user_data
 
 
 def export_groups():
     """Export all groups and their permissions."""
-    groups = []
-    for group in Group.objects.all():
-        group_data = {
-            'id': group.id,
-            'name': group.name,
-            'permissions': list(group.permissions.values_list('id', flat=True)),
-        }
-        groups.append(group_data)
-    return groups
+    permissions_by_group = defaultdict(list)
+    for group_id, permission_id in Group.permissions.through.objects.values_list('group_id', 'permission_id'):
+        permissions_by_group[group_id].append(permission_id)
+
+    for group_data in Group.objects.values('id', 'name').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        group_data['permissions'] = permissions_by_group.get(group_data['id'], [])
+        yield group_data
 
 
 def export_permissions():
     """Export all permissions with their content types."""
-    permissions = []
-    for perm in Permission.objects.all():
-        perm_data = {
+    for perm in Permission.objects.select_related('content_type').iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        yield {
             'id': perm.id,
             'name': perm.name,
             'codename': perm.codename,
@@ -89,66 +114,96 @@ def export_permissions():
                 'model': perm.content_type.model,
             }
         }
-        permissions.append(perm_data)
-    return permissions
 
 
 def export_openai_models():
     """Export OpenAI models and their user assignments."""
-    models = []
-    for model in SupportedOpenAIModel.objects.all():
-        model_data = {
+    models = SupportedOpenAIModel.objects.prefetch_related(
+        Prefetch('assigned_users', queryset=User.objects.only('id'))
+    )
+    for model in models.iterator(chunk_size=PREFETCH_CHUNK_SIZE):
+        yield {
             'id': model.id,
             'name': model.name,
             'input_cost': str(model.input_cost),
             'cached_input_cost': str(model.cached_input_cost) if model.cached_input_cost else None,
             'output_cost': str(model.output_cost) if model.output_cost else None,
-            'assigned_users': list(model.assigned_users.values_list('id', flat=True)),
+            # Served from the prefetch cache, one query per chunk
+            'assigned_users': [user.id for user in model.assigned_users.all()],
         }
-        models.append(model_data)
-    return models
-
-
-def export_all_data():
-    """Export all user-related data."""
-    print("Exporting user data...")
-    
-    data = {
-        'export_date': datetime.now().isoformat(),
-        'django_version': django.get_version(),
-        'users': export_users(),
-        'groups': export_groups(),
-        'permissions': export_permissions(),
-        'openai_models': export_openai_models(),
-    }
-    
-    print(f"Exported {len(data['users'])} users")
-    print(f"Exported {len(data['groups'])} groups")
-    print(f"Exported {len(data['permissions'])} permissions")
-    print(f"Exported {len(data['openai_models'])} OpenAI models")
-    
-    return data
+
+
+# Sections in the order the importer needs them: groups before the users
+# that reference them, users before the models assigned to them.
+EXPORT_SECTIONS = (
+    ('groups', 'groups', export_groups),
+    ('users', 'users', export_users),
+    ('openai_models', 'OpenAI models', export_openai_models),
+)
+
+# Permissions are created by Django migrations and are not needed to restore
+# a backup; they are only exported on request for auditing.
+PERMISSIONS_SECTION = ('permissions', 'permissions', export_permissions)
+
+
+def _write_record(f, record):
+    """Write a single compact JSON record followed by a newline to a binary file."""
+    if orjson is not None:
+        f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        f.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n')
+
+
+def export_all_data(output_file, include_permissions=False, quiet=False):
+    """Export all user-related data to a JSON Lines file."""
+    if not quiet:
+        print("Exporting user data...")
+
+    with open(output_file, 'wb') as f:
+        _write_record(f, {
+            'export_date': datetime.now().isoformat(),
+            'django_version': django.get_version(),
+            'schema_version': SCHEMA_VERSION,
+        })
+
+        sections = EXPORT_SECTIONS + (PERMISSIONS_SECTION,) if include_permissions else EXPORT_SECTIONS
+        for section, label, exporter in sections:
+            _write_record(f, {'section': section})
+            count = 0
+            for row in exporter():
+                _write_record(f, row)
+                count += 1
+                if not quiet and count % PROGRESS_INTERVAL == 0:
+                    print(f"  {count:,} {label}...")
+            if not quiet:
+                print(f"Exported {count} {label}")
 
 
 def main():
     """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description='Export user data for disaster recovery.')
+    parser.add_argument('output_file', nargs='?', type=Path, help='Output JSON Lines file')
+    parser.add_argument('--quiet', action='store_true', help='Suppress progress and per-section output')
+    parser.add_argument(
+        '--include-permissions',
+        action='store_true',
+        help='Also export the Permission table (for audit backups; not used on import)',
+    )
+    args = parser.parse_args()
+
     # Determine output file
-    if len(sys.argv) > 1:
-        output_file = Path(sys.argv[1])
+    if args.output_file:
+        output_file = args.output_file
     else:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = script_dir / f'user_data_backup_{timestamp}.json'
-    
+        output_file = script_dir / f'user_data_backup_{timestamp}.jsonl'
+
     # Ensure output directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    
+
     # Export data
-    data = export_all_data()
-    
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+    export_all_data(output_file, include_permissions=args.include_permissions, quiet=args.quiet)
+
     print(f"\nData exported successfully to: {output_file}")
     print(f"File size: {output_file.stat().st_size:,} bytes")
 
@@ -6,22 +6,33 @@ This script imports user-related data from a JSON backup file to recreate
 the database state for disaster recovery.
 
 Usage:
-    python scripts/backup/import_user_data.py <backup_file.json>
+    python scripts/backup/import_user_data.py [--quiet] <backup_file>
 
 Arguments:
-    backup_file.json: Path to the JSON backup file created by export_user_data.py
+    backup_file: Path to the JSON Lines backup file created by export_user_data.py.
+                 Older single-document JSON backups are also accepted.
+    --quiet: Suppress per-section progress output
 
 Warning:
-    This script will create or update users, groups, permissions, and model assignments.
+    This script will create or update users, groups, and model assignments.
     Existing data may be overwritten. Use with caution!
 """
 
 import os
 import sys
 import json
-from datetime import datetime
+import mmap
+import argparse
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from decimal import Decimal
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add the Django project to the path
 script_dir = Path(__file__).resolve().parent
@@ -37,125 +48,319 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'summarizer.settings')
 import django
 django.setup()
 
-from django.contrib.auth.models import User, Group, Permission
+from django.contrib.auth.models import User, Group
 from django.contrib.contenttypes.models import ContentType
-from django.db import transaction
-from  summarizer.home.models import SupportedOpenAIModel
+from django.db import connection, transaction
+from  summarizer.home.models import SupportedOpenAIModel, invalidate_user_models_cache
 
+# Rows per INSERT statement for bulk_create
+BULK_BATCH_SIZE = 1000
 
-def import_permissions(permissions_data):
-    """Import permissions data."""
-    print(f"Importing {len(permissions_data)} permissions...")
-    # Permissions are typically auto-created by Django, so we just verify they exist
-    return
+# Columns overwritten when an imported username already exists
+USER_UPDATE_FIELDS = [
+    'email', 'password', 'first_name', 'last_name',
+    'is_active', 'is_staff', 'is_superuser', 'date_joined', 'last_login',
+]
 
+def _parse_datetime(value):
+    """
+    Decode a backup timestamp.
 
-def import_groups(groups_data, permissions_data):
-    """Import groups and their permissions."""
-    print(f"Importing {len(groups_data)} groups...")
-    
-    for group_data in groups_data:
-        group, created = Group.objects.get_or_create(
-            name=group_data['name'],
-            defaults={'id': group_data['id']}
-        )
-        
-        # Set permissions
-        if group_data['permissions']:
-            permissions = Permission.objects.filter(id__in=group_data['permissions'])
-            group.permissions.set(permissions)
-        
-        action = "Created" if created else "Updated"
-        print(f"  {action} group: {group.name}")
-
-
-def import_users(users_data):
-    """Import users with all their data."""
-    print(f"Importing {len(users_data)} users...")
-    
-    for user_data in users_data:
-        # Create or update user
-        user, created = User.objects.update_or_create(
-            username=user_data['username'],
-            defaults={
-                'email': user_data['email'],
-                'password': user_data['password'],  # Already hashed
-                'first_name': user_data['first_name'],
-                'last_name': user_data['last_name'],
-                'is_active': user_data['is_active'],
-                'is_staff': user_data['is_staff'],
-                'is_superuser': user_data['is_superuser'],
-                'date_joined': datetime.fromisoformat(user_data['date_joined']),
-                'last_login': datetime.fromisoformat(user_data['last_login']) if user_data['last_login'] else None,
-            }
-        )
-        
-        # Set groups
-        if user_data['groups']:
-            groups = Group.objects.filter(id__in=user_data['groups'])
-            user.groups.set(groups)
-        
-        # Set user permissions
-        if user_data['user_permissions']:
-            permissions = Permission.objects.filter(id__in=user_data['user_permissions'])
-            user.user_permissions.set(permissions)
-        
-        action = "Created" if created else "Updated"
-        print(f"  {action} user: {user.username}")
-
-
-def import_openai_models(models_data):
+    Schema version 2 backups store epoch seconds; older backups store ISO 8601
+    strings. None is passed through.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value, tz=timezone.utc)
+
+
+@lru_cache(maxsize=256)
+def _dec(value):
+    """Return a shared Decimal for a cost string; empty values become None."""
+    return Decimal(value) if value else None
+
+
+def _set_m2m(through, owner_field, target_field, targets_by_owner):
+    """
+    Bulk equivalent of calling ``.set(targets)`` on each owner's M2M manager.
+
+    Clears the existing rows for every owner in ``targets_by_owner`` with one
+    DELETE and recreates them with batched INSERTs. Like ``.set()`` given a
+    filtered queryset, target ids missing from this database are skipped;
+    inserting them would fail the foreign key check when the import commits.
+    """
+    if not targets_by_owner:
+        return
+
+    target_model = next(f.related_model for f in through._meta.fields if f.attname == target_field)
+    valid_ids = set(target_model.objects.values_list('id', flat=True))
+
+    through.objects.filter(**{f'{owner_field}__in': list(targets_by_owner)}).delete()
+    through.objects.bulk_create(
+        [
+            through(**{owner_field: owner_id, target_field: target_id})
+            for owner_id, target_ids in targets_by_owner.items()
+            for target_id in target_ids
+            if target_id in valid_ids
+        ],
+        ignore_conflicts=True,
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+
+def _remap(ids, id_map):
+    """Translate backup ids to this database's ids, dropping ids that were not imported."""
+    return [id_map[source_id] for source_id in ids if source_id in id_map]
+
+
+def import_groups(groups_data, id_maps, quiet=False):
+    """Import groups and their permissions, recording backup id -> new id in id_maps['groups']."""
+    existing = set(Group.objects.values_list('name', flat=True))
+    Group.objects.bulk_create(
+        [
+            Group(id=group_data['id'], name=group_data['name'])
+            for group_data in groups_data
+            if group_data['name'] not in existing
+        ],
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+    # Set permissions
+    group_ids = dict(Group.objects.values_list('name', 'id'))
+    # Groups that already existed keep their own ids, so members are remapped by name
+    id_maps['groups'] = {group_data['id']: group_ids[group_data['name']] for group_data in groups_data}
+    _set_m2m(Group.permissions.through, 'group_id', 'permission_id', {
+        group_ids[group_data['name']]: group_data['permissions']
+        for group_data in groups_data
+        if group_data['permissions']
+    })
+
+    if not quiet:
+        _print_summary(groups_data, 'groups', existing, 'name')
+
+
+def import_users(users_data, id_maps, quiet=False):
+    """Import users with all their data, recording backup id -> new id in id_maps['users']."""
+    existing = set(User.objects.values_list('username', flat=True))
+    User.objects.bulk_create(
+        [
+            User(
+                username=user_data['username'],
+                email=user_data['email'],
+                password=user_data['password'],  # Already hashed
+                first_name=user_data['first_name'],
+                last_name=user_data['last_name'],
+                is_active=user_data['is_active'],
+                is_staff=user_data['is_staff'],
+                is_superuser=user_data['is_superuser'],
+                date_joined=_parse_datetime(user_data['date_joined']),
+                last_login=_parse_datetime(user_data['last_login']),
+            )
+            for user_data in users_data
+        ],
+        update_conflicts=True,
+        unique_fields=['username'],
+        update_fields=USER_UPDATE_FIELDS,
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+    # Set groups and user permissions. Users are matched by username, so their
+    # ids here can differ from the backup's; group ids are remapped the same way
+    user_ids = dict(User.objects.values_list('username', 'id'))
+    id_maps['users'] = {user_data['id']: user_ids[user_data['username']] for user_data in users_data}
+    group_map = id_maps.get('groups', {})
+    _set_m2m(User.groups.through, 'user_id', 'group_id', {
+        user_ids[user_data['username']]: _remap(user_data['groups'], group_map)
+        for user_data in users_data
+        if user_data['groups']
+    })
+    _set_m2m(User.user_permissions.through, 'user_id', 'permission_id', {
+        user_ids[user_data['username']]: user_data['user_permissions']
+        for user_data in users_data
+        if user_data['user_permissions']
+    })
+
+    if not quiet:
+        _print_summary(users_data, 'users', existing, 'username')
+
+
+def import_openai_models(models_data, id_maps, quiet=False):
     """Import OpenAI models and their user assignments."""
-    print(f"Importing {len(models_data)} OpenAI models...")
-    
-    for model_data in models_data:
-        model, created = SupportedOpenAIModel.objects.update_or_create(
-            name=model_data['name'],
-            defaults={
-                'input_cost': Decimal(model_data['input_cost']),
-                'cached_input_cost': Decimal(model_data['cached_input_cost']) if model_data['cached_input_cost'] else None,
-                'output_cost': Decimal(model_data['output_cost']) if model_data['output_cost'] else None,
-            }
-        )
-        
-        # Set assigned users
-        if model_data['assigned_users']:
-            users = User.objects.filter(id__in=model_data['assigned_users'])
-            model.assigned_users.set(users)
-        
-        action = "Created" if created else "Updated"
-        print(f"  {action} model: {model.name}")
-
-
-def import_all_data(backup_file):
+    existing = set(SupportedOpenAIModel.objects.values_list('name', flat=True))
+    SupportedOpenAIModel.objects.bulk_create(
+        [
+            SupportedOpenAIModel(
+                name=model_data['name'],
+                input_cost=_dec(model_data['input_cost']),
+                cached_input_cost=_dec(model_data['cached_input_cost']),
+                output_cost=_dec(model_data['output_cost']),
+            )
+            for model_data in models_data
+        ],
+        update_conflicts=True,
+        unique_fields=['name'],
+        update_fields=['input_cost', 'cached_input_cost', 'output_cost'],
+        batch_size=BULK_BATCH_SIZE,
+    )
+
+    # Set assigned users
+    model_ids = dict(SupportedOpenAIModel.objects.values_list('name', 'id'))
+    # Assignments name users by backup id; map them to the users imported above
+    user_map = id_maps.get('users', {})
+    _set_m2m(SupportedOpenAIModel.assigned_users.through, 'supportedopenaimodel_id', 'user_id', {
+        model_ids[model_data['name']]: _remap(model_data['assigned_users'], user_map)
+        for model_data in models_data
+        if model_data['assigned_users']
+    })
+    # Bulk writes to the through table bypass m2m_changed, so drop every cached model list
+    invalidate_user_models_cache(User.objects.values_list('id', flat=True))
+
+    if not quiet:
+        _print_summary(models_data, 'OpenAI models', existing, 'name')
+
+
+def _print_summary(rows, label, existing, key):
+    """Print one summary line for an imported section."""
+    updated = sum(1 for row in rows if row[key] in existing)
+    print(f"Imported {len(rows)} {label} ({len(rows) - updated} created, {updated} updated)")
+
+
+# SQLite settings applied for the duration of an import. synchronous=NORMAL
+# under WAL skips the per-transaction fsync of the rollback journal.
+SQLITE_IMPORT_PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('temp_store', 'MEMORY'),
+    ('cache_size', '-65536'),  # 64 MiB
+)
+
+
+@contextmanager
+def sqlite_import_pragmas():
+    """Apply SQLITE_IMPORT_PRAGMAS on SQLite and restore the previous values on exit."""
+    if connection.vendor != 'sqlite':
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        previous = []
+        for name, value in SQLITE_IMPORT_PRAGMAS:
+            cursor.execute(f'PRAGMA {name}')
+            previous.append((name, cursor.fetchone()[0]))
+            cursor.execute(f'PRAGMA {name}={value}')
+
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for name, value in reversed(previous):
+                cursor.execute(f'PRAGMA {name}={value}')
+
+
+def _loads(data):
+    """Decode JSON from bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_document(f):
+    """Decode a whole JSON document from a read-only memory map of an open binary file."""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if orjson is not None:
+            # orjson parses the mapped pages directly, without an intermediate read buffer
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        return json.loads(mm[:])
+
+
+# Section name -> importer. JSON Lines backups list sections in dependency order.
+# Permissions are created by Django migrations, so a 'permissions' section
+# (written by export_user_data.py --include-permissions) is skipped.
+SECTION_IMPORTERS = {
+    'groups': import_groups,
+    'users': import_users,
+    'openai_models': import_openai_models,
+}
+
+# Import order for legacy single-document backups
+LEGACY_SECTION_ORDER = ('groups', 'users', 'openai_models')
+
+
+def iter_sections(f):
+    """
+    Yield (section, rows) pairs from a JSON Lines backup, one section at a time.
+
+    rows is None for sections that have no importer.
+    """
+    section, rows = None, []
+    for line in f:
+        if not line.strip():
+            continue
+        # Rows of sections without an importer are not decoded or kept
+        if rows is None and not line.startswith(b'{"section"'):
+            continue
+        record = _loads(line)
+        if record.keys() == {'section'}:
+            if section is not None:
+                yield section, rows
+            section = record['section']
+            rows = [] if section in SECTION_IMPORTERS else None
+        else:
+            rows.append(record)
+    if section is not None:
+        yield section, rows
+
+
+def import_sections(header, sections, quiet=False):
+    """Print backup metadata and import each section inside a single transaction."""
+    if not quiet:
+        print(f"Backup created: {header['export_date']}")
+        print(f"Django version: {header['django_version']}")
+        print()
+
+    # Backup id -> new id per section, filled in by each importer for the ones after it
+    id_maps = {}
+    with sqlite_import_pragmas(), transaction.atomic():
+        for section, rows in sections:
+            if rows is None:
+                if not quiet:
+                    print(f"Skipping section: {section}")
+                continue
+            SECTION_IMPORTERS[section](rows, id_maps, quiet=quiet)
+
+
+def import_all_data(backup_file, quiet=False):
     """Import all user-related data from backup file."""
-    print(f"Loading backup from: {backup_file}")
-    
-    with open(backup_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print(f"Backup created: {data['export_date']}")
-    print(f"Django version: {data['django_version']}")
-    print()
-    
-    # Import in correct order to handle dependencies
-    with transaction.atomic():
-        import_permissions(data['permissions'])
-        import_groups(data['groups'], data['permissions'])
-        import_users(data['users'])
-        import_openai_models(data['openai_models'])
-    
+    if not quiet:
+        print(f"Loading backup from: {backup_file}")
+
+    with open(backup_file, 'rb') as f:
+        try:
+            header = _loads(f.readline())
+        except ValueError:
+            header = None
+
+        if header is None or 'users' in header:
+            # Legacy backup: a single JSON document holding every section
+            data = _load_document(f)
+            import_sections(data, ((name, data[name]) for name in LEGACY_SECTION_ORDER), quiet)
+        else:
+            import_sections(header, iter_sections(f), quiet)
+
     print("\nData import completed successfully!")
 
 
 def main():
     """Main entry point for the script."""
-    if len(sys.argv) < 2:
-        print("Error: Backup file path required")
-        print(f"Usage: {sys.argv[0]} <backup_file.json>")
-        sys.exit(1)
-    
-    backup_file = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(description='Import user data from a backup file.')
+    parser.add_argument('backup_file', type=Path, help='Backup file created by export_user_data.py')
+    parser.add_argument('--quiet', action='store_true', help='Suppress per-section progress output')
+    args = parser.parse_args()
+
+    backup_file = args.backup_file
     
     if not backup_file.exists():
         print(f"Error: Backup file not found: {backup_file}")
@@ -170,7 +375,7 @@ def main():
         print("Import cancelled.")
         sys.exit(0)
     
-    import_all_data(backup_file)
+    import_all_data(backup_file, quiet=args.quiet)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.models import User
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models import Count
 from .models import SupportedOpenAIModel
 
 @admin.register(SupportedOpenAIModel)
@@ -58,10 +59,17 @@ class UserAdmin(BaseUserAdmin):
     # Add assigned_models to the list display
     list_display = BaseUserAdmin.list_display + ('assigned_models_count',)
 
+    def get_queryset(self, request):
+        """Annotate the assigned model count so the changelist needs no per-row query."""
+        return super().get_queryset(request).annotate(
+            _assigned_models_count=Count('assigned_models', distinct=True)
+        )
+
     def assigned_models_count(self, obj):
         """Display the count of assigned models for this user."""
-        return obj.assigned_models.count()
+        return obj._assigned_models_count
     assigned_models_count.short_description = 'Assigned Models'
+    assigned_models_count.admin_order_field = '_assigned_models_count'
 
 
 # Unregister the default User admin and register our custom one
@@ -0,0 +1,16 @@
+import atexit
+import logging
+
+from django.apps import AppConfig
+
+
+class HomeConfig(AppConfig):
+    name = 'home'
+
+    def ready(self):
+        """Start the listener that drains the queued log handler set up in LOGGING."""
+        queue_handler = logging.getHandlerByName('queue')
+        listener = getattr(queue_handler, 'listener', None)
+        if listener is not None and listener._thread is None:
+            listener.start()
+            atexit.register(listener.stop)
@@ -8,6 +8,11 @@ OPENAI_API_KEY_ENV_VAR = 'OPENAI_API_KEY'
 # Content Limits
 MAX_TEXT_LENGTH = 50000
 MAX_URL_CONTENT_LENGTH = 10000
+# Raw HTML is mostly markup, so the byte budget is far larger than the text budget
+MAX_URL_DOWNLOAD_BYTES = 2 * 1024 * 1024
+
+# HTML elements whose text is not page content
+NON_CONTENT_TAGS = ('script', 'style', 'noscript', 'svg', 'head')
 
 # API Parameters
 DEFAULT_TEMPERATURE = 0.5
@@ -15,12 +20,93 @@ DEFAULT_MAX_TOKENS = 150
 GPT5_MAX_TOKENS = 300
 
 # Model Lists
-NEWER_MODELS = ['gpt-4o', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-4o-mini', 'gpt-5-nano']
-RESTRICTED_TEMP_MODELS = ['gpt-5-nano']
-GPT5_NANO_MODELS = ['gpt-5-nano']
+NEWER_MODELS = frozenset({'gpt-4o', 'gpt-4-turbo', 'gpt-3.5-turbo', 'gpt-4o-mini', 'gpt-5-nano'})
+RESTRICTED_TEMP_MODELS = frozenset({'gpt-5-nano'})
+GPT5_NANO_MODELS = frozenset({'gpt-5-nano'})
+
+# OpenAI model pricing in USD per million tokens
+# Each entry: (name, input_cost, cached_input_cost, output_cost)
+OPENAI_MODEL_PRICING = (
+    ('gpt-5.1', 1.25, 0.125, 10.00),
+    ('gpt-5', 1.25, 0.125, 10.00),
+    ('gpt-5-mini', 0.25, 0.025, 2.00),
+    ('gpt-5-nano', 0.05, 0.005, 0.40),
+    ('gpt-5.1-chat-latest', 1.25, 0.125, 10.00),
+    ('gpt-5-chat-latest', 1.25, 0.125, 10.00),
+    ('gpt-5.1-codex-max', 1.25, 0.125, 10.00),
+    ('gpt-5.1-codex', 1.25, 0.125, 10.00),
+    ('gpt-5-codex', 1.25, 0.125, 10.00),
+    ('gpt-5-pro', 15.00, None, 120.00),
+    ('gpt-4.1', 2.00, 0.50, 8.00),
+    ('gpt-4.1-mini', 0.40, 0.10, 1.60),
+    ('gpt-4.1-nano', 0.10, 0.025, 0.40),
+    ('gpt-4o', 2.50, 1.25, 10.00),
+    ('gpt-4o-2024-05-13', 5.00, None, 15.00),
+    ('gpt-4o-mini', 0.15, 0.075, 0.60),
+    ('gpt-realtime', 4.00, 0.40, 16.00),
+    ('gpt-realtime-mini', 0.60, 0.06, 2.40),
+    ('gpt-4o-realtime-preview', 5.00, 2.50, 20.00),
+    ('gpt-4o-mini-realtime-preview', 0.60, 0.30, 2.40),
+    ('gpt-audio', 2.50, None, 10.00),
+    ('gpt-audio-mini', 0.60, None, 2.40),
+    ('gpt-4o-audio-preview', 2.50, None, 10.00),
+    ('gpt-4o-mini-audio-preview', 0.15, None, 0.60),
+    ('o1', 15.00, 7.50, 60.00),
+    ('o1-pro', 150.00, None, 600.00),
+    ('o3-pro', 20.00, None, 80.00),
+    ('o3', 2.00, 0.50, 8.00),
+    ('o3-deep-research', 10.00, 2.50, 40.00),
+    ('o4-mini', 1.10, 0.275, 4.40),
+    ('o4-mini-deep-research', 2.00, 0.50, 8.00),
+    ('o3-mini', 1.10, 0.55, 4.40),
+    ('o1-mini', 1.10, 0.55, 4.40),
+    ('gpt-5.1-codex-mini', 0.25, 0.025, 2.00),
+    ('codex-mini-latest', 1.50, 0.375, 6.00),
+    ('gpt-5-search-api', 1.25, 0.125, 10.00),
+    ('gpt-4o-mini-search-preview', 0.15, None, 0.60),
+    ('gpt-4o-search-preview', 2.50, None, 10.00),
+    ('computer-use-preview', 3.00, None, 12.00),
+    ('gpt-image-1', 5.00, 1.25, None),
+    ('gpt-image-1-mini', 2.00, 0.20, None),
+)
+
+# Semantic summary cache
+EMBEDDING_MODEL = 'text-embedding-3-small'
+EMBEDDING_DIMENSIONS = 256
+SEMANTIC_CACHE_EMBED_CHARS = 2000
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_ENTRIES = 512
+
+# URL summary cache (seconds)
+URL_SUMMARY_CACHE_TIMEOUT = 3600
+URL_TEXT_CACHE_TIMEOUT = 600
+
+# Background audio generation
+TTS_JOB_WORKERS = 2
+
+# Synthesized audio cache
+TTS_CACHE_DIR = 'tts_cache'
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+TTS_LANG = 'en'
+TTS_SLOW = False
+
+# OpenAI retries (transient errors only)
+OPENAI_RETRY_ATTEMPTS = 6
+OPENAI_RETRY_MIN_WAIT = 1
+OPENAI_RETRY_MAX_WAIT = 30
+
+# Per-user assigned model list cache (seconds)
+USER_MODELS_CACHE_TIMEOUT = 300
+
+# Per-user cache of the rendered summarization forms (seconds)
+SUMMARY_FORM_CACHE_TIMEOUT = 60 * 5
 
 # Request Timeouts
 URL_REQUEST_TIMEOUT = 10
+OPENAI_REQUEST_TIMEOUT = 60
+
+# Outbound HTTP
+URL_REQUEST_USER_AGENT = 'Mozilla/5.0 (compatible; AI-Summarizer/1.0)'
 
 # Logging
 LOG_FORMAT = '%(levelname)s %(asctime)s %(module)s %(process)d %(thread)d %(message)s'
@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import User
-from home.models import SupportedOpenAIModel
+from home.models import SupportedOpenAIModel, invalidate_user_models_cache
 
 class Command(BaseCommand):
     help = 'Assign AI models to users for access control'
@@ -42,21 +42,30 @@ class Command(BaseCommand):
             models = SupportedOpenAIModel.objects.all()
         else:
             models = SupportedOpenAIModel.objects.filter(name__in=model_names)
-            
-        if not models.exists():
+        models = list(models.values_list('id', 'name'))
+
+        if not models:
             self.stdout.write(
                 self.style.WARNING('No models found with the specified names')
             )
             return
 
+        # Work on the through table directly with ids; no model instances needed
+        Assignment = User.assigned_models.through
+        model_ids = [model_id for model_id, _ in models]
         if remove_models:
-            user.assigned_models.remove(*models)
+            Assignment.objects.filter(user_id=user.id, supportedopenaimodel_id__in=model_ids).delete()
             action = 'removed from'
         else:
-            user.assigned_models.add(*models)
+            Assignment.objects.bulk_create(
+                [Assignment(user_id=user.id, supportedopenaimodel_id=model_id) for model_id in model_ids],
+                ignore_conflicts=True,
+            )
             action = 'assigned to'
+        # Through-table writes don't send m2m_changed
+        invalidate_user_models_cache([user.id])
 
-        model_list = ', '.join([model.name for model in models])
+        model_list = ', '.join([name for _, name in models])
         self.stdout.write(
             self.style.SUCCESS(
                 f'Successfully {action} user "{username}": {model_list}'
@@ -64,9 +73,9 @@ class Command(BaseCommand):
         )
 
         # Show current assignments
-        current_models = user.assigned_models.all()
-        if current_models.exists():
-            current_list = ', '.join([model.name for model in current_models])
+        current_models = list(user.assigned_models.values_list('name', flat=True))
+        if current_models:
+            current_list = ', '.join(current_models)
             self.stdout.write(f'Current assignments: {current_list}')
         else:
             self.stdout.write('User has no model assignments')
\ No newline at end of file
@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
-from summarizer.home.models import SupportedOpenAIModel
+from django.db import transaction
+from summarizer.home.models import SupportedOpenAIModel, invalidate_user_models_cache
 
 User = get_user_model()
 import os
@@ -63,17 +64,25 @@ class Command(BaseCommand):
         
         # Check model assignments
         self.stdout.write('\n4. Checking Model Assignments...')
-        users_without_models = User.objects.filter(assigned_models__isnull=True, is_superuser=False)
-        if users_without_models.exists():
-            count = users_without_models.count()
+        user_ids = list(
+            User.objects.filter(assigned_models__isnull=True, is_superuser=False).values_list('id', flat=True)
+        )
+        count = len(user_ids)
+        if count:
             issues_found.append(f'{count} users have no model assignments')
             self.stdout.write(self.style.WARNING(f'   ⚠ {count} users have no model assignments'))
             
             if fix_issues and SupportedOpenAIModel.objects.exists():
                 # Assign a default model to users without assignments
                 default_model = SupportedOpenAIModel.objects.first()
-                for user in users_without_models:
-                    user.assigned_models.add(default_model)
+                Assignment = User.assigned_models.through
+                with transaction.atomic():
+                    Assignment.objects.bulk_create(
+                        [Assignment(user_id=user_id, supportedopenaimodel_id=default_model.id) for user_id in user_ids],
+                        ignore_conflicts=True,
+                        batch_size=1000,
+                    )
+                invalidate_user_models_cache(user_ids)
                 self.stdout.write(self.style.SUCCESS(f'   ✓ Fixed: Assigned {default_model.name} to {count} users'))
         else:
             self.stdout.write(self.style.SUCCESS('   ✓ All users have model assignments'))
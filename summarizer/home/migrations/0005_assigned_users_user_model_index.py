@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Add a (user_id, supportedopenaimodel_id) index to the auto-created
+    assigned_users through table.
+
+    The table's unique constraint leads with supportedopenaimodel_id, so lookups
+    and admin filters that start from the user could not use it as a covering
+    index. The through model is auto-created, so the index is added with SQL.
+    """
+
+    dependencies = [
+        ('home', '0004_rename_openaimodel_supportedopenaimodel'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX home_assigned_users_user_model_idx '
+                'ON home_supportedopenaimodel_assigned_users (user_id, supportedopenaimodel_id);'
+            ),
+            reverse_sql='DROP INDEX home_assigned_users_user_model_idx;',
+        ),
+    ]
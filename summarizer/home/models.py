@@ -1,4 +1,9 @@
+from typing import Iterable
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
 
 class SupportedOpenAIModel(models.Model):
@@ -47,4 +52,41 @@ class SupportedOpenAIModel(models.Model):
         """Meta options for the SupportedOpenAIModel."""
         verbose_name = "OpenAI Model"
         verbose_name_plural = "OpenAI Models"
-        ordering = ['name']
\ No newline at end of file
+        ordering = ['name']
+
+
+def user_models_cache_key(user_id: int) -> str:
+    """Return the cache key for a user's assigned model names."""
+    return f'user_model_names:{user_id}'
+
+
+def invalidate_user_models_cache(user_ids: Iterable[int]) -> None:
+    """
+    Drop cached assigned model lists for the given users.
+
+    Call this after changing assignments through the through table directly
+    (e.g. bulk_create), which does not send m2m_changed.
+    """
+    cache.delete_many([user_models_cache_key(user_id) for user_id in user_ids])
+
+
+@receiver(m2m_changed, sender=SupportedOpenAIModel.assigned_users.through)
+def assigned_users_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidate cached model lists when assignments change from either side."""
+    if reverse:
+        # user.assigned_models.add/remove/clear: instance is the user
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            invalidate_user_models_cache([instance.pk])
+    elif action in ('post_add', 'post_remove'):
+        invalidate_user_models_cache(pk_set)
+    elif action == 'pre_clear':
+        # pk_set is not provided for clear, so collect the users before they are removed
+        invalidate_user_models_cache(instance.assigned_users.values_list('id', flat=True))
+
+
+@receiver(post_save, sender=SupportedOpenAIModel)
+@receiver(pre_delete, sender=SupportedOpenAIModel)
+def supported_model_changed(sender, instance, **kwargs):
+    """Invalidate cached model lists when an assigned model is renamed or deleted."""
+    if instance.pk:
+        invalidate_user_models_cache(instance.assigned_users.values_list('id', flat=True))
@@ -0,0 +1,110 @@
+"""
+In-process semantic cache for summaries.
+
+Summaries are looked up first by an exact hash of the normalized input and
+then by cosine similarity of input embeddings, so repeated or near-identical
+requests are answered without another chat completion.
+"""
+
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Sequence
+
+from .constants import SEMANTIC_CACHE_MAX_ENTRIES, SEMANTIC_CACHE_THRESHOLD
+
+
+class CacheKey(NamedTuple):
+    """Identifies a summarization request for cache lookups."""
+
+    digest: str
+    model_name: str
+    system_hash: str
+    length: int
+
+
+class _Entry(NamedTuple):
+    key: CacheKey
+    embedding: Optional[List[float]]
+    summary: str
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and case so trivially different inputs share a key."""
+    return ' '.join(text.split()).casefold()
+
+
+def normalize_vector(vector: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length so a dot product is its cosine similarity."""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """Thread-safe LRU of summaries with exact and nearest-neighbour lookup."""
+
+    def __init__(self, max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+                 threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model_name: str, system_message: str, text: str) -> CacheKey:
+        """Build the cache key for summarizing text with a model and system message."""
+        normalized = normalize_text(text)
+        system_hash = hashlib.sha1(system_message.encode()).hexdigest()
+        digest = hashlib.sha1(f'{model_name}|{system_hash}|{normalized}'.encode()).hexdigest()
+        return CacheKey(digest, model_name, system_hash, len(normalized))
+
+    def get_exact(self, key: CacheKey) -> Optional[str]:
+        """Return the summary stored for exactly this input, if any."""
+        with self._lock:
+            entry = self._entries.get(key.digest)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key.digest)
+            return entry.summary
+
+    def search(self, key: CacheKey, embedding: List[float]) -> Optional[str]:
+        """Return the summary of the most similar input above the threshold, if any."""
+        with self._lock:
+            candidates = list(self._entries.values())
+
+        best_score, best = self.threshold, None
+        for entry in candidates:
+            if (entry.embedding is None
+                    or entry.key.model_name != key.model_name
+                    or entry.key.system_hash != key.system_hash):
+                continue
+            # Similar meaning is not enough for inputs of very different length
+            if abs(entry.key.length - key.length) > 0.1 * max(entry.key.length, key.length):
+                continue
+            score = sum(a * b for a, b in zip(entry.embedding, embedding))
+            if score > best_score:
+                best_score, best = score, entry
+
+        if best is None:
+            return None
+        with self._lock:
+            if best.key.digest in self._entries:
+                self._entries.move_to_end(best.key.digest)
+        return best.summary
+
+    def add(self, key: CacheKey, embedding: Optional[List[float]], summary: str) -> None:
+        """Store a summary, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key.digest] = _Entry(key, embedding, summary)
+            self._entries.move_to_end(key.digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached summaries."""
+        with self._lock:
+            self._entries.clear()
+
+
+semantic_cache = SemanticCache()
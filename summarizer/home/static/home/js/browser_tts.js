@@ -0,0 +1,33 @@
+// Browser-based speech synthesis helpers, loaded on demand via the tts-engines endpoint
+function speakText(text) {
+    if ('speechSynthesis' in window) {
+        speechSynthesis.cancel();
+        const utterance = new SpeechSynthesisUtterance(text);
+        utterance.rate = 0.9;
+        utterance.pitch = 1;
+        utterance.volume = 0.8;
+
+        const voices = speechSynthesis.getVoices();
+        const englishVoice = voices.find(voice =>
+            voice.lang.startsWith('en') &&
+            (voice.name.toLowerCase().includes('female') ||
+             voice.name.toLowerCase().includes('samantha'))
+        );
+
+        if (englishVoice) {
+            utterance.voice = englishVoice;
+        }
+
+        speechSynthesis.speak(utterance);
+        return true;
+    } else {
+        console.warn('Speech synthesis not supported');
+        return false;
+    }
+}
+
+function stopSpeech() {
+    if ('speechSynthesis' in window) {
+        speechSynthesis.cancel();
+    }
+}
@@ -14,11 +14,102 @@ document.addEventListener('DOMContentLoaded', function() {
         button.classList.remove('loading');
     }
 
+    // Show stream errors in the same list the server renders Django messages into
+    function showError(form, message) {
+        let list = form.parentNode.querySelector('ul.messages');
+        if (!list) {
+            list = document.createElement('ul');
+            list.className = 'messages';
+            form.parentNode.appendChild(list);
+        }
+        const item = document.createElement('li');
+        item.className = 'message error';
+        item.textContent = message;
+        list.appendChild(item);
+    }
+
+    // Stream the summary over Server-Sent Events, appending text as it arrives
+    async function streamSummary(form) {
+        const result = document.getElementById('summary-result');
+        const summaryText = document.getElementById('summary-text');
+        const status = document.getElementById('summary-status');
+        const wordCount = document.getElementById('word-count');
+        const empty = document.getElementById('summary-empty');
+
+        const response = await fetch(form.action || window.location.href, {
+            method: 'POST',
+            headers: {
+                'Accept': 'text/event-stream',
+                'X-CSRFToken': form.querySelector('[name=csrfmiddlewaretoken]').value
+            },
+            body: new FormData(form)
+        });
+        if (!response.ok || !(response.headers.get('Content-Type') || '').startsWith('text/event-stream')) {
+            throw new Error(`Unexpected response (${response.status})`);
+        }
+
+        form.parentNode.querySelectorAll('ul.messages').forEach(list => list.remove());
+        summaryText.textContent = '';
+        status.textContent = 'Generating...';
+        wordCount.textContent = '0 words';
+
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        let completed = false;
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const message = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                let event = 'message';
+                let data = '';
+                message.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) event = line.slice(7);
+                    else if (line.startsWith('data: ')) data += line.slice(6);
+                });
+                const payload = data ? JSON.parse(data) : {};
+
+                if (event === 'error') {
+                    showError(form, payload.error);
+                } else if (event === 'done') {
+                    completed = true;
+                } else if (payload.delta) {
+                    if (empty) empty.hidden = true;
+                    result.hidden = false;
+                    summaryText.textContent += payload.delta;
+                    wordCount.textContent = `${summaryText.textContent.trim().split(/\s+/).length} words`;
+                }
+            }
+        }
+        status.textContent = completed ? 'Complete' : 'Incomplete';
+    }
+
     // Form submission handling with loading states
     const forms = document.querySelectorAll('#summary-form');
     forms.forEach(form => {
         form.addEventListener('submit', function(e) {
             const submitBtn = form.querySelector('button[type="submit"]');
+            const canStream = window.fetch && window.TextDecoderStream && document.getElementById('summary-result');
+
+            if (canStream) {
+                e.preventDefault();
+                if (submitBtn) showLoading(submitBtn, 'Summarizing...');
+                streamSummary(form)
+                    .catch(error => {
+                        console.error('Streaming summary failed, submitting normally:', error);
+                        form.submit();
+                    })
+                    .finally(() => {
+                        if (submitBtn) hideLoading(submitBtn);
+                    });
+                return;
+            }
+
             if (submitBtn) {
                 showLoading(submitBtn, 'Summarizing...');
                 // Set timeout to prevent indefinite loading
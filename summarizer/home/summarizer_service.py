@@ -6,19 +6,111 @@ including model configuration and API call handling.
 """
 
 import os
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 import openai
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.core.cache import cache
+from tenacity import (
+    before_sleep_log, retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+)
 
 from .constants import (
     OPENAI_API_KEY_ENV_VAR, MAX_TEXT_LENGTH, MAX_URL_CONTENT_LENGTH,
     DEFAULT_TEMPERATURE, DEFAULT_MAX_TOKENS, GPT5_MAX_TOKENS,
-    NEWER_MODELS, RESTRICTED_TEMP_MODELS, GPT5_NANO_MODELS, URL_REQUEST_TIMEOUT
+    NEWER_MODELS, RESTRICTED_TEMP_MODELS, GPT5_NANO_MODELS, URL_REQUEST_TIMEOUT,
+    OPENAI_REQUEST_TIMEOUT, URL_REQUEST_USER_AGENT, NON_CONTENT_TAGS, MAX_URL_DOWNLOAD_BYTES,
+    EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, SEMANTIC_CACHE_EMBED_CHARS,
+    URL_SUMMARY_CACHE_TIMEOUT, URL_TEXT_CACHE_TIMEOUT,
+    OPENAI_RETRY_ATTEMPTS, OPENAI_RETRY_MIN_WAIT, OPENAI_RETRY_MAX_WAIT
 )
+from .semantic_cache import CacheKey, normalize_vector, semantic_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_client(api_key: Optional[str]) -> openai.OpenAI:
+    """Return a process-wide OpenAI client so its HTTP connection pool is reused."""
+    # Retries are handled by _retry_openai so they are logged and not compounded
+    return openai.OpenAI(api_key=api_key, max_retries=0, timeout=OPENAI_REQUEST_TIMEOUT)
+
+
+# (client, event loop it was created on); see _get_async_client
+_async_client_state: Tuple[Optional[openai.AsyncOpenAI], Optional[asyncio.AbstractEventLoop]] = (None, None)
+
+
+def _get_async_client() -> openai.AsyncOpenAI:
+    """
+    Return an AsyncOpenAI client bound to the running event loop.
+
+    Under ASGI every request in a worker shares one loop, so a single client and
+    its connection pool are reused. Pooled connections cannot outlive their loop,
+    so when the loop changes (e.g. async views under the WSGI dev server) a new
+    client is created.
+    """
+    global _async_client_state
+    loop = asyncio.get_running_loop()
+    client, client_loop = _async_client_state
+    if client is None or client_loop is not loop:
+        client = openai.AsyncOpenAI(
+            api_key=os.getenv(OPENAI_API_KEY_ENV_VAR), max_retries=0, timeout=OPENAI_REQUEST_TIMEOUT
+        )
+        _async_client_state = (client, loop)
+    return client
+
+
+def _is_transient_openai_error(e: BaseException) -> bool:
+    """Return True for OpenAI errors worth retrying: rate limits, timeouts and dropped connections."""
+    if isinstance(e, openai.RateLimitError):
+        # An exhausted quota is reported as a 429 too, but waiting will not fix it
+        return getattr(e, 'code', None) != 'insufficient_quota'
+    return isinstance(e, openai.APIConnectionError)  # includes APITimeoutError
+
+
+# Exponential backoff with jitter; the last error is re-raised for _api_error to translate
+_retry_openai = retry(
+    retry=retry_if_exception(_is_transient_openai_error),
+    wait=wait_random_exponential(min=OPENAI_RETRY_MIN_WAIT, max=OPENAI_RETRY_MAX_WAIT),
+    stop=stop_after_attempt(OPENAI_RETRY_ATTEMPTS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
+
+@_retry_openai
+def _create_chat_completion(api_params: Dict[str, Any]):
+    return _get_client(os.getenv(OPENAI_API_KEY_ENV_VAR)).chat.completions.create(**api_params)
+
+
+@_retry_openai
+async def _create_chat_completion_async(api_params: Dict[str, Any], **kwargs):
+    return await _get_async_client().chat.completions.create(**api_params, **kwargs)
+
+
+def _build_http_session() -> requests.Session:
+    """Build a pooled HTTP session for fetching URLs, kept for the life of the worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = URL_REQUEST_USER_AGENT
+    return session
+
+
+_http = _build_http_session()
+
+
 class OpenAIService:
     """Service class for handling OpenAI API interactions."""
 
@@ -33,65 +125,148 @@ class OpenAIService:
     GPT5_MAX_TOKENS = GPT5_MAX_TOKENS
 
     @staticmethod
-    def get_api_params(model_name: str, system_message: str, user_content: str) -> Dict[str, Any]:
-        """Generate API parameters for OpenAI chat completion."""
+    @lru_cache(maxsize=64)
+    def get_model_options(model_name: str) -> Tuple[float, str, int]:
+        """
+        Return (temperature, token limit parameter name, token limit) for a model.
+
+        These depend only on the model name, so the substring matching against
+        the model lists runs once per model rather than on every request.
+        """
         use_max_completion_tokens = any(model in model_name for model in OpenAIService.NEWER_MODELS)
         use_restricted_temp = any(model in model_name for model in OpenAIService.RESTRICTED_TEMP_MODELS)
         is_gpt5_nano = any(model in model_name for model in OpenAIService.GPT5_NANO_MODELS)
 
-        api_params = {
+        temperature = 1 if use_restricted_temp else OpenAIService.DEFAULT_TEMPERATURE
+
+        if is_gpt5_nano:
+            return temperature, 'max_completion_tokens', OpenAIService.GPT5_MAX_TOKENS
+        elif use_max_completion_tokens:
+            return temperature, 'max_completion_tokens', OpenAIService.DEFAULT_MAX_TOKENS
+        else:
+            return temperature, 'max_tokens', OpenAIService.DEFAULT_MAX_TOKENS
+
+    @staticmethod
+    def get_api_params(model_name: str, system_message: str, user_content: str) -> Dict[str, Any]:
+        """Generate API parameters for OpenAI chat completion."""
+        temperature, token_param, token_limit = OpenAIService.get_model_options(model_name)
+
+        return {
             'model': model_name,
             'messages': [
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": user_content}
             ],
+            'temperature': temperature,
+            token_param: token_limit,
         }
 
-        # Set temperature
-        api_params['temperature'] = 1 if use_restricted_temp else OpenAIService.DEFAULT_TEMPERATURE
-
-        # Set token limits
-        if is_gpt5_nano:
-            api_params['max_completion_tokens'] = OpenAIService.GPT5_MAX_TOKENS
-        elif use_max_completion_tokens:
-            api_params['max_completion_tokens'] = OpenAIService.DEFAULT_MAX_TOKENS
-        else:
-            api_params['max_tokens'] = OpenAIService.DEFAULT_MAX_TOKENS
+    @staticmethod
+    def get_client() -> openai.OpenAI:
+        """Return the shared OpenAI client for the configured API key."""
+        return _get_client(os.getenv(OPENAI_API_KEY_ENV_VAR))
 
-        return api_params
+    @staticmethod
+    def get_async_client() -> openai.AsyncOpenAI:
+        """Return the shared AsyncOpenAI client for the running event loop."""
+        return _get_async_client()
 
     @staticmethod
-    def call_openai_api(api_params: Dict[str, Any]) -> Optional[str]:
-        """Make API call to OpenAI and return the response content."""
-        try:
-            client = openai.OpenAI(api_key=os.getenv(OPENAI_API_KEY_ENV_VAR))
-            response = client.chat.completions.create(**api_params)
-            content = response.choices[0].message.content
+    def _response_content(response) -> Optional[str]:
+        """Return the stripped message content of a chat completion, or None if empty."""
+        content = response.choices[0].message.content
 
-            if content and content.strip():
-                return content.strip()
+        if content and content.strip():
+            return content.strip()
 
-            logger.warning("Empty or whitespace-only response from OpenAI API")
-            return None
+        logger.warning("Empty or whitespace-only response from OpenAI API")
+        return None
 
-        except openai.AuthenticationError as e:
+    @staticmethod
+    def _api_error(e: Exception) -> ValueError:
+        """Log an OpenAI client error and translate it into a user-facing ValueError."""
+        if isinstance(e, openai.AuthenticationError):
             logger.error(f"OpenAI authentication error: {str(e)}")
-            raise ValueError("Authentication error with AI service. Please check your API key configuration.")
-        except openai.RateLimitError as e:
+            return ValueError("Authentication error with AI service. Please check your API key configuration.")
+        if isinstance(e, openai.RateLimitError):
             logger.warning(f"OpenAI rate limit exceeded: {str(e)}")
-            raise ValueError("Rate limit exceeded. Please try again in a few minutes.")
-        except openai.APIError as e:
+            return ValueError("Rate limit exceeded. Please try again in a few minutes.")
+        if isinstance(e, openai.APIError):
             logger.error(f"OpenAI API error: {str(e)}")
             error_msg = str(e).lower()
             if "max_tokens" in error_msg:
-                raise ValueError("Model configuration error. Please contact support.")
+                return ValueError("Model configuration error. Please contact support.")
             elif "context_length" in error_msg:
-                raise ValueError("Text is too long for this model. Please try with shorter text.")
+                return ValueError("Text is too long for this model. Please try with shorter text.")
             else:
-                raise ValueError("AI service temporarily unavailable. Please try again.")
+                return ValueError("AI service temporarily unavailable. Please try again.")
+        logger.error(f"Unexpected OpenAI API error: {str(e)}", exc_info=e)
+        return ValueError("An unexpected error occurred. Our team has been notified.")
+
+    @staticmethod
+    def call_openai_api(api_params: Dict[str, Any]) -> Optional[str]:
+        """Make API call to OpenAI and return the response content."""
+        try:
+            response = _create_chat_completion(api_params)
+            return OpenAIService._response_content(response)
+        except Exception as e:
+            raise OpenAIService._api_error(e)
+
+    @staticmethod
+    async def call_openai_api_async(api_params: Dict[str, Any]) -> Optional[str]:
+        """Async version of call_openai_api; the event loop is free while waiting on OpenAI."""
+        try:
+            response = await _create_chat_completion_async(api_params)
+            return OpenAIService._response_content(response)
+        except Exception as e:
+            raise OpenAIService._api_error(e)
+
+    @staticmethod
+    async def stream_openai_api_async(api_params: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream a chat completion from OpenAI, yielding content deltas as they arrive."""
+        try:
+            # Only opening the stream is retried; a stream that fails part-way is not replayed
+            stream = await _create_chat_completion_async(api_params, stream=True)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except Exception as e:
-            logger.error(f"Unexpected OpenAI API error: {str(e)}", exc_info=True)
-            raise ValueError("An unexpected error occurred. Our team has been notified.")
+            raise OpenAIService._api_error(e)
+
+    @staticmethod
+    def _embedding_input(text: str) -> str:
+        """Return the whitespace-collapsed text that is embedded for cache lookups."""
+        # Callers only embed inputs that fit (see SummaryService._semantic_eligible);
+        # the slice just bounds the request size
+        return ' '.join(text.split())[:SEMANTIC_CACHE_EMBED_CHARS]
+
+    @staticmethod
+    def embed(text: str) -> Optional[List[float]]:
+        """Return a unit-length embedding of the text, or None on failure."""
+        try:
+            response = OpenAIService.get_client().embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=OpenAIService._embedding_input(text),
+                dimensions=EMBEDDING_DIMENSIONS,
+            )
+            return normalize_vector(response.data[0].embedding)
+        except Exception as e:
+            logger.warning(f"Embedding request failed, skipping semantic cache: {str(e)}")
+            return None
+
+    @staticmethod
+    async def embed_async(text: str) -> Optional[List[float]]:
+        """Async version of embed."""
+        try:
+            response = await OpenAIService.get_async_client().embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=OpenAIService._embedding_input(text),
+                dimensions=EMBEDDING_DIMENSIONS,
+            )
+            return normalize_vector(response.data[0].embedding)
+        except Exception as e:
+            logger.warning(f"Embedding request failed, skipping semantic cache: {str(e)}")
+            return None
 
 
 class ContentProcessor:
@@ -103,21 +278,39 @@ class ContentProcessor:
     @staticmethod
     def validate_text_length(text: str) -> None:
         """Validate text length and raise ValueError if too long."""
-        if len(text) > ContentProcessor.MAX_TEXT_LENGTH:
-            raise ValueError(f"Text is too long ({len(text):,} characters). Maximum allowed is {ContentProcessor.MAX_TEXT_LENGTH:,} characters.")
+        length = len(text)
+        if length > ContentProcessor.MAX_TEXT_LENGTH:
+            raise ValueError(f"Text is too long ({length:,} characters). Maximum allowed is {ContentProcessor.MAX_TEXT_LENGTH:,} characters.")
+
+    @staticmethod
+    def fetch_url_content(url: str) -> str:
+        """
+        Download a page body, stopping after MAX_URL_DOWNLOAD_BYTES.
+
+        Only the first part of a page is summarized, so there is no need to
+        download and decode the rest of a very large response.
+        """
+        with _http.get(url, timeout=URL_REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_URL_DOWNLOAD_BYTES:
+                    break
+            return b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
 
     @staticmethod
     def extract_text_from_url(url: str) -> str:
         """Extract text content from a URL."""
-        import requests
-        from bs4 import BeautifulSoup
-
         try:
-            response = requests.get(url, timeout=URL_REQUEST_TIMEOUT)
-            response.raise_for_status()
-            content = response.text
+            content = ContentProcessor.fetch_url_content(url)
 
-            soup = BeautifulSoup(content, 'html.parser')
+            # lxml builds the tree in C; drop script/style/etc. before extracting text
+            soup = BeautifulSoup(content, 'lxml')
+            for tag in soup(NON_CONTENT_TAGS):
+                tag.decompose()
             text = soup.get_text(separator=' ', strip=True)
 
             return text[:ContentProcessor.MAX_URL_CONTENT_LENGTH]
@@ -130,39 +323,219 @@ class ContentProcessor:
 class SummaryService:
     """Service class for handling summarization operations."""
 
+    # The instruction lives in the system message so the (possibly very large)
+    # input can be sent as the user message without copying it into a prompt
+    TEXT_INSTRUCTION = "Summarize the text provided by the user."
+    URL_SYSTEM_MESSAGE = (
+        "You are a helpful assistant that summarizes web page content. "
+        "Summarize the web page content provided by the user."
+    )
+
     @staticmethod
-    def summarize_text(text: str, model_name: str, system_message: str) -> str:
-        """Summarize text using OpenAI API."""
+    def _text_api_params(text: str, model_name: str, system_message: str) -> Dict[str, Any]:
+        """Validate text and build the API parameters for summarizing it."""
         ContentProcessor.validate_text_length(text)
 
-        api_params = OpenAIService.get_api_params(
+        return OpenAIService.get_api_params(
+            model_name=model_name,
+            system_message=f"{system_message} {SummaryService.TEXT_INSTRUCTION}",
+            user_content=text
+        )
+
+    @staticmethod
+    def _url_api_params(text: str, model_name: str) -> Dict[str, Any]:
+        """Build the API parameters for summarizing extracted web page text."""
+        return OpenAIService.get_api_params(
             model_name=model_name,
-            system_message=system_message,
-            user_content=f"Summarize the following text:\n\n{text}"
+            system_message=SummaryService.URL_SYSTEM_MESSAGE,
+            user_content=text
         )
 
-        summary = OpenAIService.call_openai_api(api_params)
+    @staticmethod
+    def _require_summary(summary: Optional[str]) -> str:
+        """Return the summary, raising ValueError if the model returned nothing."""
         if not summary:
             raise ValueError("The AI model returned an empty response. Please try again.")
+        return summary
 
+    @staticmethod
+    def _cache_key(text: str, api_params: Dict[str, Any]) -> CacheKey:
+        """Build the semantic cache key for a prepared summarization request."""
+        return semantic_cache.make_key(api_params['model'], api_params['messages'][0]['content'], text)
+
+    @staticmethod
+    def _semantic_eligible(key: CacheKey) -> bool:
+        """
+        Return True if the input is short enough to be embedded whole.
+
+        A partial embedding would match revisions of a long document that share
+        its opening, so longer inputs only use the exact-match tier.
+        """
+        return key.length <= SEMANTIC_CACHE_EMBED_CHARS
+
+    @staticmethod
+    def _summarize_cached(text: str, api_params: Dict[str, Any], semantic: bool = True) -> str:
+        """
+        Return a cached summary for the text, calling OpenAI and caching the result on a miss.
+
+        With semantic=False only an exact match is used and no embedding is requested.
+        """
+        key = SummaryService._cache_key(text, api_params)
+        semantic = semantic and SummaryService._semantic_eligible(key)
+        summary = semantic_cache.get_exact(key)
+        if summary:
+            logger.info("Summary cache hit (exact) for model %s", key.model_name)
+            return summary
+
+        embedding = OpenAIService.embed(text) if semantic else None
+        if embedding is not None:
+            summary = semantic_cache.search(key, embedding)
+            if summary:
+                logger.info("Summary cache hit (semantic) for model %s", key.model_name)
+                return summary
+
+        summary = SummaryService._require_summary(OpenAIService.call_openai_api(api_params))
+        semantic_cache.add(key, embedding, summary)
+        return summary
+
+    @staticmethod
+    async def _cache_lookup_async(text: str, api_params: Dict[str, Any],
+                                  semantic: bool = True) -> Tuple[CacheKey, Optional[List[float]], Optional[str]]:
+        """Look the request up in the semantic cache, returning (key, embedding, cached summary)."""
+        key = SummaryService._cache_key(text, api_params)
+        semantic = semantic and SummaryService._semantic_eligible(key)
+        summary = semantic_cache.get_exact(key)
+        if summary:
+            logger.info("Summary cache hit (exact) for model %s", key.model_name)
+            return key, None, summary
+
+        if not semantic:
+            return key, None, None
+
+        embedding = await OpenAIService.embed_async(text)
+        if embedding is not None:
+            # The similarity scan is pure Python; keep it off the event loop
+            summary = await asyncio.to_thread(semantic_cache.search, key, embedding)
+            if summary:
+                logger.info("Summary cache hit (semantic) for model %s", key.model_name)
+                return key, embedding, summary
+
+        return key, embedding, None
+
+    @staticmethod
+    async def _summarize_cached_async(text: str, api_params: Dict[str, Any], semantic: bool = True) -> str:
+        """Async version of _summarize_cached."""
+        key, embedding, summary = await SummaryService._cache_lookup_async(text, api_params, semantic)
+        if summary:
+            return summary
+
+        summary = SummaryService._require_summary(await OpenAIService.call_openai_api_async(api_params))
+        semantic_cache.add(key, embedding, summary)
         return summary
 
+    @staticmethod
+    async def _stream_cached_async(text: str, api_params: Dict[str, Any],
+                                   semantic: bool = True) -> AsyncIterator[str]:
+        """Stream a summary, yielding a cached one whole and caching a streamed one once complete."""
+        key, embedding, summary = await SummaryService._cache_lookup_async(text, api_params, semantic)
+        if summary:
+            yield summary
+            return
+
+        parts = []
+        async for delta in OpenAIService.stream_openai_api_async(api_params):
+            parts.append(delta)
+            yield delta
+
+        summary = SummaryService._require_summary(''.join(parts).strip())
+        semantic_cache.add(key, embedding, summary)
+
+    @staticmethod
+    def summarize_text(text: str, model_name: str, system_message: str) -> str:
+        """Summarize text using OpenAI API."""
+        api_params = SummaryService._text_api_params(text, model_name, system_message)
+        return SummaryService._summarize_cached(text, api_params)
+
+    @staticmethod
+    def _url_cache_keys(url: str, model_name: str) -> Tuple[str, str]:
+        """Return the cache keys for a URL's summary (per model) and extracted text."""
+        summary_key = 'urlsum:' + hashlib.sha1(f'{url}|{model_name}'.encode()).hexdigest()
+        text_key = 'urltext:' + hashlib.sha1(url.encode()).hexdigest()
+        return summary_key, text_key
+
     @staticmethod
     def summarize_url(url: str, model_name: str) -> str:
         """Summarize URL content using OpenAI API."""
-        text = ContentProcessor.extract_text_from_url(url)
+        summary_key, text_key = SummaryService._url_cache_keys(url, model_name)
+        summary = cache.get(summary_key)
+        if summary:
+            logger.info("URL summary cache hit for %s (%s)", url, model_name)
+            return summary
+
+        text = cache.get(text_key)
+        if text is None:
+            text = ContentProcessor.extract_text_from_url(url)
+            cache.set(text_key, text, timeout=URL_TEXT_CACHE_TIMEOUT)
+
+        api_params = SummaryService._url_api_params(text, model_name)
+        # Page text is truncated to a fixed length and usually opens with the same
+        # site boilerplate, so similar embeddings don't mean similar pages
+        summary = SummaryService._summarize_cached(text, api_params, semantic=False)
+        cache.set(summary_key, summary, timeout=URL_SUMMARY_CACHE_TIMEOUT)
+        return summary
 
-        system_message = "You are a helpful assistant that summarizes web page content."
-        user_content = f"Summarize the following web page content:\n\n{text}"
+    @staticmethod
+    async def summarize_text_async(text: str, model_name: str, system_message: str) -> str:
+        """Async version of summarize_text."""
+        api_params = SummaryService._text_api_params(text, model_name, system_message)
+        return await SummaryService._summarize_cached_async(text, api_params)
 
-        api_params = OpenAIService.get_api_params(
-            model_name=model_name,
-            system_message=system_message,
-            user_content=user_content
-        )
+    @staticmethod
+    async def summarize_url_async(url: str, model_name: str) -> str:
+        """Async version of summarize_url; the blocking fetch and parse run in a worker thread."""
+        summary_key, text_key = SummaryService._url_cache_keys(url, model_name)
+        summary = await cache.aget(summary_key)
+        if summary:
+            logger.info("URL summary cache hit for %s (%s)", url, model_name)
+            return summary
+
+        text = await SummaryService._url_text_async(url, text_key)
+        api_params = SummaryService._url_api_params(text, model_name)
+        summary = await SummaryService._summarize_cached_async(text, api_params, semantic=False)
+        await cache.aset(summary_key, summary, timeout=URL_SUMMARY_CACHE_TIMEOUT)
+        return summary
 
-        summary = OpenAIService.call_openai_api(api_params)
-        if not summary:
-            raise ValueError("The AI model returned an empty response. Please try again.")
+    @staticmethod
+    async def _url_text_async(url: str, text_key: str) -> str:
+        """Return the extracted text of a URL, from the cache or by fetching it in a worker thread."""
+        text = await cache.aget(text_key)
+        if text is None:
+            text = await asyncio.to_thread(ContentProcessor.extract_text_from_url, url)
+            await cache.aset(text_key, text, timeout=URL_TEXT_CACHE_TIMEOUT)
+        return text
 
-        return summary
\ No newline at end of file
+    @staticmethod
+    async def summarize_text_stream(text: str, model_name: str, system_message: str) -> AsyncIterator[str]:
+        """Streaming version of summarize_text, yielding the summary as it is generated."""
+        api_params = SummaryService._text_api_params(text, model_name, system_message)
+        async for delta in SummaryService._stream_cached_async(text, api_params):
+            yield delta
+
+    @staticmethod
+    async def summarize_url_stream(url: str, model_name: str) -> AsyncIterator[str]:
+        """Streaming version of summarize_url, yielding the summary as it is generated."""
+        summary_key, text_key = SummaryService._url_cache_keys(url, model_name)
+        summary = await cache.aget(summary_key)
+        if summary:
+            logger.info("URL summary cache hit for %s (%s)", url, model_name)
+            yield summary
+            return
+
+        text = await SummaryService._url_text_async(url, text_key)
+        api_params = SummaryService._url_api_params(text, model_name)
+        parts = []
+        async for delta in SummaryService._stream_cached_async(text, api_params, semantic=False):
+            parts.append(delta)
+            yield delta
+
+        await cache.aset(summary_key, ''.join(parts).strip(), timeout=URL_SUMMARY_CACHE_TIMEOUT)
@@ -6,27 +6,61 @@ speech synthesis and Google TTS as fallback.
 """
 
 import os
+import hashlib
 import logging
+import threading
+import platform
 import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.functional import cached_property
+
+from .constants import (
+    TTS_JOB_WORKERS, TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES, TTS_LANG, TTS_SLOW
+)
+
 logger = logging.getLogger(__name__)
 
+# Optional TTS backends, probed once at import
+try:
+    from gtts import gTTS
+    _GTTS_OK = True
+except ImportError:
+    gTTS = None
+    _GTTS_OK = False
+    logger.warning("Google TTS not available. Install with: pip install gtts")
 
-class TTSManager:
-    """Simplified TTS manager focusing on essential functionality."""
+try:
+    import pyttsx3
+    _PYTTSX3_OK = True
+except ImportError:
+    pyttsx3 = None
+    _PYTTSX3_OK = False
 
-    def __init__(self):
-        self._gtts_available = self._check_gtts_availability()
+# The host OS does not change while the process runs
+_SYSTEM = platform.system().lower()
 
-    def _check_gtts_availability(self) -> bool:
-        """Check if Google TTS is available."""
-        try:
-            import gtts
-            return True
-        except ImportError:
-            logger.warning("Google TTS not available. Install with: pip install gtts")
-            return False
+
+def _audio_cache_dir() -> str:
+    return os.path.join(settings.MEDIA_ROOT, TTS_CACHE_DIR)
+
+
+def audio_cache_key(text: str) -> str:
+    """Return the content hash identifying the synthesized audio for text."""
+    return hashlib.blake2b(f'{TTS_LANG}|{TTS_SLOW}|{text}'.encode(), digest_size=16).hexdigest()
+
+
+def audio_cache_path(key: str) -> str:
+    """Return where the synthesized audio for a cache key is stored."""
+    return os.path.join(_audio_cache_dir(), f'{key}.mp3')
+
+
+class TTSManager:
+    """Simplified TTS manager focusing on essential functionality."""
 
     def speak_text(self, text: str) -> bool:
         """Speak text using available TTS engine."""
@@ -34,65 +68,111 @@ class TTSManager:
             return False
 
         # Try Google TTS first (better quality)
-        if self._gtts_available:
+        if _GTTS_OK:
             return self._speak_with_google_tts(text)
 
         # Fallback to system TTS
         return self._speak_with_system_tts(text)
 
+    def speak(self, text: str, engine: str = 'google') -> bool:
+        """Speak text with the named engine ('google', 'pyttsx3'/'system' or 'browser')."""
+        if not text or not text.strip():
+            return False
+
+        if engine == 'google':
+            if not _GTTS_OK:
+                logger.warning("Google TTS requested but not available")
+                return False
+            return self._speak_with_google_tts(text)
+        if engine in ('pyttsx3', 'system'):
+            return self._speak_with_system_tts(text)
+        if engine == 'browser':
+            logger.warning("Browser TTS runs client-side and cannot be used on the server")
+            return False
+
+        logger.warning(f"Unknown TTS engine: {engine}")
+        return False
+
+    def supports_audio_files(self, engine: str) -> bool:
+        """Return True if the named engine can produce audio files; only Google TTS can."""
+        return engine == 'google' and _GTTS_OK
+
     def generate_audio_file(self, text: str) -> Optional[str]:
-        """Generate audio file for download."""
+        """
+        Generate audio file for download.
+
+        Files are cached by a hash of the text and voice settings, so the
+        returned path is shared and must not be deleted by the caller.
+        """
         if not text or not text.strip():
             return None
 
-        if not self._gtts_available:
+        if not _GTTS_OK:
             logger.warning("Audio file generation requires Google TTS")
             return None
 
         try:
-            from gtts import gTTS
+            cache_dir = _audio_cache_dir()
+            path = audio_cache_path(audio_cache_key(text))
+
+            if os.path.exists(path):
+                # Refresh the mtime so eviction drops the least recently used files
+                os.utime(path)
+                return path
 
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(suffix='.part', dir=cache_dir, delete=False) as temp_file:
                 temp_path = temp_file.name
 
-            tts = gTTS(text=text, lang='en', slow=False)
-            tts.save(temp_path)
-            return temp_path
+            try:
+                tts = gTTS(text=text, lang=TTS_LANG, slow=TTS_SLOW)
+                tts.save(temp_path)
+                os.replace(temp_path, path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+
+            self._evict_audio_cache(cache_dir)
+            return path
 
         except Exception as e:
             logger.error(f"Audio file generation error: {e}")
             return None
 
+    def _evict_audio_cache(self, cache_dir: str) -> None:
+        """Delete the least recently used cached files once the cache exceeds its size limit."""
+        files = []
+        total = 0
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.mp3'):
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        for _, size, path in sorted(files):
+            if total <= TTS_CACHE_MAX_BYTES:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
     def _speak_with_google_tts(self, text: str) -> bool:
         """Speak text using Google TTS."""
-        try:
-            from gtts import gTTS
-            import subprocess
-            import platform
-
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            # Generate speech
-            tts = gTTS(text=text, lang='en', slow=False)
-            tts.save(temp_path)
-
-            # Play the audio
-            success = self._play_audio_file(temp_path)
-
-            # Clean up
-            os.unlink(temp_path)
-            return success
-
-        except Exception as e:
-            logger.error(f"Google TTS error: {e}")
+        audio_file = self.generate_audio_file(text)
+        if not audio_file:
             return False
+        return self._play_audio_file(audio_file)
 
     def _speak_with_system_tts(self, text: str) -> bool:
         """Speak text using system TTS (pyttsx3)."""
-        try:
-            import pyttsx3
+        if not _PYTTSX3_OK:
+            logger.warning("System TTS not available. Install with: pip install pyttsx3")
+            return False
 
+        try:
             engine = pyttsx3.init()
             engine.setProperty('rate', 180)
             engine.setProperty('volume', 0.9)
@@ -101,9 +181,6 @@ class TTSManager:
             engine.runAndWait()
             return True
 
-        except ImportError:
-            logger.warning("System TTS not available. Install with: pip install pyttsx3")
-            return False
         except Exception as e:
             logger.error(f"System TTS error: {e}")
             return False
@@ -111,18 +188,17 @@ class TTSManager:
     def _play_audio_file(self, file_path: str) -> bool:
         """Play audio file using system default player."""
         try:
-            import subprocess
-            import platform
-
-            system = platform.system().lower()
-            if system == 'darwin':  # macOS
-                subprocess.run(['afplay', file_path], check=True, capture_output=True)
-            elif system == 'linux':
-                subprocess.run(['mpg123', file_path], check=True, capture_output=True)
-            elif system == 'windows':
+            # Player output is never read, so discard it rather than buffering it in a pipe
+            if _SYSTEM == 'darwin':  # macOS
+                subprocess.run(['afplay', file_path], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elif _SYSTEM == 'linux':
+                subprocess.run(['mpg123', '-q', file_path], check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            elif _SYSTEM == 'windows':
                 os.startfile(file_path)
             else:
-                logger.warning(f"Audio playback not supported on {system}")
+                logger.warning(f"Audio playback not supported on {_SYSTEM}")
                 return False
 
             return True
@@ -136,6 +212,11 @@ class TTSManager:
 
     def get_available_engines(self) -> list:
         """Get list of available TTS engines."""
+        return self.available_engines
+
+    @cached_property
+    def available_engines(self) -> list:
+        """Available TTS engines; installed packages do not change while the process runs."""
         engines = []
 
         # Browser TTS (always available in modern browsers)
@@ -148,19 +229,18 @@ class TTSManager:
         # Google TTS
         engines.append({
             'name': 'google',
-            'available': self._gtts_available,
+            'available': _GTTS_OK,
             'description': 'Google Text-to-Speech'
         })
 
         # System TTS
-        try:
-            import pyttsx3
+        if _PYTTSX3_OK:
             engines.append({
                 'name': 'system',
                 'available': True,
                 'description': 'System text-to-speech'
             })
-        except ImportError:
+        else:
             engines.append({
                 'name': 'system',
                 'available': False,
@@ -173,58 +253,69 @@ class TTSManager:
 # Global TTS manager instance
 tts_manager = TTSManager()
 
+# gTTS makes a network round-trip per request, so audio files are generated
+# off the request thread and collected by polling. A job is identified by the
+# audio cache key, so its result is the cached file itself.
+_audio_job_executor = ThreadPoolExecutor(max_workers=TTS_JOB_WORKERS, thread_name_prefix='tts-job')
+_pending_audio_jobs = set()
+_pending_audio_jobs_lock = threading.Lock()
 
-class BrowserTTSTTS:
-    """Browser-based TTS utility class."""
 
-    @staticmethod
-    def get_javascript() -> str:
-        """Return JavaScript code for browser-based TTS."""
-        return """
-        function speakText(text) {
-            if ('speechSynthesis' in window) {
-                speechSynthesis.cancel();
-                const utterance = new SpeechSynthesisUtterance(text);
-                utterance.rate = 0.9;
-                utterance.pitch = 1;
-                utterance.volume = 0.8;
-
-                const voices = speechSynthesis.getVoices();
-                const englishVoice = voices.find(voice =>
-                    voice.lang.startsWith('en') &&
-                    (voice.name.toLowerCase().includes('female') ||
-                     voice.name.toLowerCase().includes('samantha'))
-                );
-
-                if (englishVoice) {
-                    utterance.voice = englishVoice;
-                }
-
-                speechSynthesis.speak(utterance);
-                return true;
-            } else {
-                console.warn('Speech synthesis not supported');
-                return false;
-            }
-        }
-
-        function stopSpeech() {
-            if ('speechSynthesis' in window) {
-                speechSynthesis.cancel();
-            }
-        }
-        """
+def _audio_job_failed_marker(job_id: str) -> str:
+    return os.path.join(_audio_cache_dir(), f'{job_id}.failed')
+
+
+def audio_job_path(job_id: str) -> str:
+    """Return where the finished audio file for a job is published."""
+    return audio_cache_path(job_id)
+
+
+def audio_job_failed(job_id: str) -> bool:
+    """Return True if generation for the job failed."""
+    return os.path.exists(_audio_job_failed_marker(job_id))
+
 
+def _run_audio_job(job_id: str, text: str) -> None:
+    """Generate audio for a job, leaving a failure marker if it cannot be produced."""
+    try:
+        if tts_manager.generate_audio_file(text):
+            return
+        open(_audio_job_failed_marker(job_id), 'w').close()
+    except Exception as e:
+        logger.error(f"Audio job {job_id} failed: {e}")
+    finally:
+        with _pending_audio_jobs_lock:
+            _pending_audio_jobs.discard(job_id)
 
-# Backward compatibility functions
-def speak_summary(text: str) -> bool:
-    """Backward compatibility function."""
-    return tts_manager.speak_text(text)
 
+def start_audio_job(text: str) -> str:
+    """Queue audio generation for text, unless it is cached or queued, and return the job id to poll."""
+    job_id = audio_cache_key(text)
+    if os.path.exists(audio_job_path(job_id)):
+        return job_id
 
-def get_summary_audio_file(text: str) -> Optional[str]:
-    """Backward compatibility function."""
-    return tts_manager.generate_audio_file(text)
+    with _pending_audio_jobs_lock:
+        if job_id in _pending_audio_jobs:
+            return job_id
+        _pending_audio_jobs.add(job_id)
+
+    os.makedirs(_audio_cache_dir(), exist_ok=True)
+    try:
+        os.unlink(_audio_job_failed_marker(job_id))
+    except FileNotFoundError:
+        pass
+
+    _audio_job_executor.submit(_run_audio_job, job_id, text)
+    return job_id
+
+
+class BrowserTTSTTS:
+    """Browser-based TTS utility class."""
+
+    @staticmethod
+    def get_javascript() -> str:
+        """Return the static URL of the JavaScript for browser-based TTS."""
+        return static('home/js/browser_tts.js')
 
 
 def speak_summary(text: str, engine: str = 'pyttsx3') -> bool:
@@ -239,17 +330,3 @@ def speak_summary(text: str, engine: str = 'pyttsx3') -> bool:
         bool: True if successful
     """
     return tts_manager.speak(text, engine)
-
-
-def get_summary_audio_file(text: str, engine: str = 'google') -> Optional[str]:
-    """
-    Generate audio file for summary text.
-
-    Args:
-        text: The text to convert to audio
-        engine: TTS engine to use ('pyttsx3', 'google', 'browser')
-
-    Returns:
-        str or None: Path to audio file, or None if failed
-    """
-    return tts_manager.get_audio_file(text, engine)
\ No newline at end of file
@@ -23,6 +23,7 @@ urlpatterns = [
     # Text-to-Speech endpoints
     path('speak-summary/', views.speak_summary_text, name='speak_summary'),
     path('get-audio/', views.get_summary_audio, name='get_audio'),
+    path('get-audio/<slug:job_id>/', views.get_audio_job, name='get_audio_job'),
     path('tts-engines/', views.get_tts_engines, name='tts_engines'),
 
     # Blog creation endpoint
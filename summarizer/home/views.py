@@ -1,25 +1,54 @@
 import os
 import json
 import uuid
+import asyncio
 import logging
 from typing import Dict, Any
+from urllib.parse import urlsplit
+from asgiref.sync import sync_to_async
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import logout
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, FileResponse
 from django.views.decorators.http import require_POST
 from django.conf import settings
 from django.utils import timezone
-import openai
+from django.urls import reverse
+from django.template.loader import get_template
 from .models import SupportedOpenAIModel
-from .tts_utils import speak_summary, get_summary_audio_file, tts_manager, BrowserTTSTTS
-from .summarizer_service import SummaryService
+from .tts_utils import (
+    speak_summary, tts_manager, BrowserTTSTTS, start_audio_job, audio_job_path, audio_job_failed
+)
+from .summarizer_service import OpenAIService, SummaryService
 from .views_base import BaseSummarizationView
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Compiled once at import rather than rebuilt for every blog post
+_BLOG_TEMPLATE = get_template('home/blog_post.html')
+
+
+def json_response(data: Dict[str, Any], status: int = 200) -> HttpResponse:
+    """Return a JSON response, encoded with orjson when it is installed."""
+    if orjson is None:
+        return JsonResponse(data, status=status)
+    return HttpResponse(orjson.dumps(data), content_type='application/json', status=status)
+
+
+def json_loads(body: bytes) -> Any:
+    """Decode a JSON request body, with orjson when it is installed."""
+    if orjson is None:
+        return json.loads(body)
+    return orjson.loads(body)
+
 def index(request):
     """
     Render the home page of the AI Text Summarizer application.
@@ -30,15 +59,14 @@ def index(request):
     logger.info("Home page accessed")
     return render(request, 'home/index.html')
 
-@login_required
-def summary(request):
+async def summary(request):
     """
     Handle text summarization requests.
 
     This view processes POST requests containing text to summarize using OpenAI's API.
     It filters available models to show only those assigned to the current user.
     """
-    return TextSummarizationView.as_view()(request)
+    return await TextSummarizationView.as_view()(request)
 
 
 class TextSummarizationView(BaseSummarizationView):
@@ -47,26 +75,33 @@ class TextSummarizationView(BaseSummarizationView):
     template_name = 'home/summary.html'
     system_message = "You are a helpful assistant that summarizes text."
 
-    def process_input(self, request, selected_model: str) -> str:
-        """Process text input and return summary."""
+    def read_input(self, request, selected_model: str) -> str:
+        """Return the submitted text."""
         text = request.POST.get('text', '').strip()
         if not text:
             raise ValueError("Please enter some text to summarize.")
 
-        logger.info(f"Summarization request received - User: {request.user.username}, "
-                   f"Text length: {len(text)}, Model: {selected_model}")
+        logger.info("Summarization request received - User: %s, Text length: %d, Model: %s",
+                    request.user.username, len(text), selected_model)
 
-        return SummaryService.summarize_text(text, selected_model, self.system_message)
+        return text
 
-@login_required
-def url_summary(request):
+    async def summarize(self, value: str, selected_model: str) -> str:
+        """Summarize the submitted text."""
+        return await SummaryService.summarize_text_async(value, selected_model, self.system_message)
+
+    def summarize_stream(self, value: str, selected_model: str):
+        """Stream the summary of the submitted text."""
+        return SummaryService.summarize_text_stream(value, selected_model, self.system_message)
+
+async def url_summary(request):
     """
     Handle URL summarization requests.
 
     This view processes POST requests containing a URL to summarize using OpenAI's API.
     It fetches the content from the URL and summarizes it.
     """
-    return URLSummarizationView.as_view()(request)
+    return await URLSummarizationView.as_view()(request)
 
 
 class URLSummarizationView(BaseSummarizationView):
@@ -80,16 +115,24 @@ class URLSummarizationView(BaseSummarizationView):
         context['url'] = kwargs.get('url', '')
         return context
 
-    def process_input(self, request, selected_model: str) -> str:
-        """Process URL input and return summary."""
+    def read_input(self, request, selected_model: str) -> str:
+        """Return the submitted URL."""
         url = request.POST.get('url', '').strip()
         if not url:
             raise ValueError("Please enter a valid URL.")
 
-        logger.info(f"URL summarization request received - User: {request.user.username}, "
-                   f"URL: {url}, Model: {selected_model}")
+        logger.info("URL summarization request received - User: %s, URL: %s, Model: %s",
+                    request.user.username, url, selected_model)
+
+        return url
 
-        return SummaryService.summarize_url(url, selected_model)
+    async def summarize(self, value: str, selected_model: str) -> str:
+        """Summarize the page at the submitted URL."""
+        return await SummaryService.summarize_url_async(value, selected_model)
+
+    def summarize_stream(self, value: str, selected_model: str):
+        """Stream the summary of the page at the submitted URL."""
+        return SummaryService.summarize_url_stream(value, selected_model)
 
 @login_required
 def logout_view(request):
@@ -126,7 +169,9 @@ def profile_view(request):
     Superusers see a notice about having access to all models.
     """
     user = request.user
-    assigned_models = user.assigned_models.all().order_by('name')
+    # The template only lists model names; fetch just those, in one query,
+    # and sort the few of them here rather than in SQL
+    assigned_models = sorted(user.assigned_models.order_by().values_list('name', flat=True))
 
     logger.info(f"User {user.username} accessed profile page")
 
@@ -141,39 +186,42 @@ def profile_view(request):
 
 @login_required
 @require_POST
-def speak_summary_text(request):
+async def speak_summary_text(request):
     """
     AJAX endpoint to speak summary text using TTS.
 
     Expects POST data with 'text' and optional 'engine' parameters.
     Returns JSON response indicating success/failure.
     """
+    request.user = await request.auser()
     text = request.POST.get('text', '').strip()
     engine = request.POST.get('engine', 'pyttsx3')
 
     if not text:
-        return JsonResponse({'success': False, 'error': 'No text provided'})
+        return json_response({'success': False, 'error': 'No text provided'})
 
     logger.info(f"User {request.user.username} requested TTS for summary (engine: {engine})")
 
     try:
-        success = speak_summary(text, engine)
+        # Local playback blocks until speech finishes, so keep it off the event loop
+        success = await sync_to_async(speak_summary, thread_sensitive=False)(text, engine)
         if success:
-            return JsonResponse({'success': True})
+            return json_response({'success': True})
         else:
-            return JsonResponse({'success': False, 'error': f'TTS engine "{engine}" failed or not available'})
+            return json_response({'success': False, 'error': f'TTS engine "{engine}" failed or not available'})
     except Exception as e:
         logger.error(f"TTS error for user {request.user.username}: {str(e)}")
-        return JsonResponse({'success': False, 'error': 'TTS service error'})
+        return json_response({'success': False, 'error': 'TTS service error'})
 
 
 @login_required
 def get_summary_audio(request):
     """
-    Generate and return audio file for summary text.
+    Start generating an audio file for summary text.
 
     Expects GET parameters 'text' and optional 'engine'.
-    Returns audio file as HTTP response.
+    Returns 202 with a job id and the URL to poll for the finished file, or
+    400 if the engine cannot produce audio files.
     """
     text = request.GET.get('text', '').strip()
     engine = request.GET.get('engine', 'google')
@@ -181,43 +229,72 @@ def get_summary_audio(request):
     if not text:
         return HttpResponse('No text provided', status=400)
 
+    if not tts_manager.supports_audio_files(engine):
+        return HttpResponse(f'TTS engine "{engine}" cannot generate audio files',
+                            content_type='text/plain', status=400)
+
     logger.info(f"User {request.user.username} requested audio file for summary (engine: {engine})")
 
+    job_id = start_audio_job(text)
+    return json_response({
+        'job_id': job_id,
+        'status_url': reverse('get_audio_job', args=[job_id]),
+    }, status=202)
+
+
+@login_required
+def get_audio_job(request, job_id):
+    """
+    Return the audio file for a generation job once it is ready.
+
+    Returns 202 while the job is still running and 500 if it failed. The file
+    is streamed from disk with FileResponse, so servers can use sendfile and
+    the MP3 is never read into memory. Cached files are left in place and
+    removed by the cache's own eviction.
+    """
     try:
-        audio_file = get_summary_audio_file(text, engine)
-        if audio_file and os.path.exists(audio_file):
-            # Return audio file
-            with open(audio_file, 'rb') as f:
-                response = HttpResponse(f.read(), content_type='audio/mpeg')
-                response['Content-Disposition'] = 'attachment; filename="summary.mp3"'
-            # Clean up temp file
-            os.unlink(audio_file)
-            return response
-        else:
-            return HttpResponse(f'Audio generation failed with engine "{engine}"', status=500)
-    except Exception as e:
-        logger.error(f"Audio generation error for user {request.user.username}: {str(e)}")
-        return HttpResponse('Audio generation error', status=500)
+        return FileResponse(
+            open(audio_job_path(job_id), 'rb'),
+            content_type='audio/mpeg', as_attachment=True, filename='summary.mp3'
+        )
+    except FileNotFoundError:
+        pass
+
+    if audio_job_failed(job_id):
+        logger.error(f"Audio generation failed for user {request.user.username} (job {job_id})")
+        return HttpResponse('Audio generation failed', status=500)
+
+    return json_response({'job_id': job_id, 'status': 'pending'}, status=202)
+
+
+def _write_blog_file(filepath: str, html_content: str) -> None:
+    """Write a generated blog post, creating the blogs directory if needed."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(html_content)
 
 
 @login_required
-def create_blog(request):
+async def create_blog(request):
     """
     Create a blog post from a summary using AI.
     """
     if request.method != 'POST':
-        return JsonResponse({'success': False, 'error': 'Method not allowed'})
+        return json_response({'success': False, 'error': 'Method not allowed'})
+
+    request.user = await request.auser()
 
     try:
-        data = json.loads(request.body)
+        data = json_loads(request.body)
         summary = data.get('summary', '').strip()
         source_url = data.get('source_url', '')
 
-        if not summary:
-            return JsonResponse({'success': False, 'error': 'No summary provided'})
+        # The URL becomes a link in the published page; escaping alone does not stop javascript: URLs
+        if urlsplit(source_url).scheme not in ('http', 'https'):
+            source_url = ''
 
-        # Generate blog content using OpenAI
-        client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        if not summary:
+            return json_response({'success': False, 'error': 'No summary provided'})
 
         # Create blog post prompt
         blog_prompt = f"""
@@ -234,96 +311,37 @@ def create_blog(request):
         Format the response as a complete HTML blog post with proper heading tags.
         """
 
-        response = client.chat.completions.create(
-            model='gpt-3.5-turbo',
-            messages=[
+        # Generate blog content using OpenAI (with retries on transient errors)
+        blog_content = await OpenAIService.call_openai_api_async({
+            'model': 'gpt-3.5-turbo',
+            'messages': [
                 {"role": "system", "content": "You are a professional blog writer who creates engaging, well-structured blog posts."},
                 {"role": "user", "content": blog_prompt}
             ],
-            max_tokens=1000,
-            temperature=0.7
-        )
-
-        blog_content = response.choices[0].message.content.strip()
+            'max_tokens': 1000,
+            'temperature': 0.7,
+        })
+        if not blog_content:
+            raise ValueError("The AI model returned an empty response. Please try again.")
 
         # Generate unique filename
         filename = f"blog_{request.user.username}_{uuid.uuid4().hex[:8]}.html"
         filepath = os.path.join(settings.MEDIA_ROOT, 'blogs', filename)
 
-        # Ensure blogs directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
         # Create HTML blog post
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AI Generated Blog - {request.user.username}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-        }}
-        p {{
-            color: #555;
-            margin-bottom: 15px;
-        }}
-        .footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #eee;
-            color: #777;
-            font-size: 0.9em;
-            text-align: center;
-        }}
-        .source {{
-            font-style: italic;
-            color: #666;
-            margin-top: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        {blog_content}
-        <div class="source">
-            <p>Source: <a href="{source_url}" target="_blank">{source_url}</a></p>
-            <p>Generated by AI Text Summarizer</p>
-        </div>
-        <div class="footer">
-            <p>Generated on {timezone.now().strftime('%B %d, %Y')} by {request.user.username}</p>
-        </div>
-    </div>
-</body>
-</html>"""
-
-        # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = _BLOG_TEMPLATE.render({
+            'blog_content': blog_content,
+            'source_url': source_url,
+            'username': request.user.username,
+            'date': timezone.now().strftime('%B %d, %Y'),
+        })
+
+        # Write to file without blocking the event loop
+        await asyncio.to_thread(_write_blog_file, filepath, html_content)
 
         # Return success response
         blog_url = f"{request.scheme}://{request.get_host()}/media/blogs/{filename}"
-        return JsonResponse({
+        return json_response({
             'success': True,
             'blog_url': blog_url,
             'message': 'Blog post created successfully!'
@@ -331,7 +349,7 @@ def create_blog(request):
 
     except Exception as e:
         logger.error(f"Blog creation error for user {request.user.username}: {str(e)}")
-        return JsonResponse({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
 
 @login_required
@@ -339,10 +357,10 @@ def get_tts_engines(request):
     """
     Return available TTS engines as JSON.
 
-    Returns JSON object with engine names and availability status.
+    Returns JSON object with engine names and availability status, and the
+    static URL of the browser TTS script.
     """
-    engines = tts_manager.get_available_engines()
-    return JsonResponse({
-        'engines': engines,
-        'browser_tts_js': BrowserTTSTTS.get_javascript()
+    return json_response({
+        'engines': tts_manager.available_engines,
+        'browser_tts_js_url': BrowserTTSTTS.get_javascript()
     })
\ No newline at end of file
@@ -5,51 +5,99 @@ This module provides base classes and utilities for handling
 summarization requests with reduced code duplication.
 """
 
+import hashlib
+import json
 import logging
-from typing import Optional, Dict, Any
-from django.shortcuts import render
+from typing import Optional, Dict, Any, AsyncIterator
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template.loader import get_template
+from django.template.response import TemplateResponse
 from django.contrib import messages
-from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import redirect_to_login
+from django.core.cache import cache
+from django.middleware.csrf import get_token
+from django.utils.cache import get_conditional_response, quote_etag
 from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 from django.views import View
 
-from .models import SupportedOpenAIModel
+from .constants import USER_MODELS_CACHE_TIMEOUT, SUMMARY_FORM_CACHE_TIMEOUT
+from .models import user_models_cache_key
 
 logger = logging.getLogger(__name__)
 
 
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format a Server-Sent Events message with a JSON payload."""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
 class SummarizationMixin:
     """Mixin class providing common summarization functionality."""
 
-    def get_user_models(self, request) -> tuple:
-        """Get user's assigned models and check availability."""
-        models = request.user.assigned_models.all().order_by('name')
+    async def get_model_names(self, request) -> list:
+        """Return the sorted names of the user's assigned models, from the cache when possible."""
+        # Assignments change rarely, so the list is cached per user and invalidated
+        # by signals in models.py. The cache may be per process, so it only feeds
+        # the model dropdown; access checks query the database (see resolve_models)
+        key = user_models_cache_key(request.user.pk)
+        models = await cache.aget(key)
+        if models is None:
+            # order_by() clears the Meta ordering; a handful of names sorts faster here than in SQL
+            models = [
+                name async for name in request.user.assigned_models.order_by().values_list('name', flat=True)
+            ]
+            models.sort()
+            await cache.aset(key, models, USER_MODELS_CACHE_TIMEOUT)
+        return models
+
+    def no_models_error(self, request) -> None:
+        """Log and report that the user has no models assigned."""
+        logger.warning("User %s has no assigned models available", request.user.username)
+        messages.error(request, "No AI models are currently assigned to your account. Please contact an administrator.")
 
-        if not models.exists():
-            logger.warning(f"User {request.user.username} has no assigned models available")
-            messages.error(request, "No AI models are currently assigned to your account. Please contact an administrator.")
+    async def get_user_models(self, request) -> tuple:
+        """Get user's assigned models and check availability."""
+        models = await self.get_model_names(request)
+        if not models:
+            self.no_models_error(request)
             return models, None
+        return models, models[0]
+
+    async def resolve_models(self, request, requested_name: Optional[str]) -> tuple:
+        """
+        Get the user's models and resolve the model to summarize with.
 
-        selected_model = models.first().name
-        return models, selected_model
+        Returns (model names, selected model name). The name is the requested model,
+        or the default when none was requested, and None when the user has no
+        models or may not use the requested one. The selected model is checked
+        against the database, so a revoked assignment takes effect at once even
+        while another process still has the old list cached.
+        """
+        models = await self.get_model_names(request)
+        name = requested_name or (models[0] if models else None)
+        if name is not None and await request.user.assigned_models.filter(name=name).aexists():
+            return models, name
 
-    def validate_model_access(self, request, models, selected_model: str) -> bool:
-        """Validate that the selected model is available to the user."""
-        if not models.filter(name=selected_model).exists():
-            logger.warning(f"User {request.user.username} attempted to use unauthorized model: {selected_model}")
+        if requested_name is None:
+            self.no_models_error(request)
+        else:
+            logger.warning("User %s attempted to use unauthorized model: %s", request.user.username, requested_name)
             messages.error(request, "Selected model is not available for your account.")
-            return False
-        return True
+        return models, None
 
     def handle_summarization_error(self, request, error: Exception, context: str) -> None:
         """Handle summarization errors with appropriate messaging."""
-        try:
-            # Re-raise ValueError messages as Django messages
-            raise error
-        except ValueError as ve:
-            messages.error(request, str(ve))
-        except Exception as e:
-            logger.error(f"Unexpected error during {context}: {str(e)}", exc_info=True)
+        if isinstance(error, ValueError):
+            # ValueError messages are user-facing
+            messages.error(request, str(error))
+        else:
+            logger.error(
+                f"Unexpected error during {context}: {str(error)}",
+                exc_info=(type(error), error, error.__traceback__),
+            )
             messages.error(request, "An unexpected error occurred. Our team has been notified.")
 
     def get_base_context(self, models, selected_model: str, **kwargs) -> Dict[str, Any]:
@@ -63,45 +111,157 @@ class SummarizationMixin:
         return context
 
 
-@method_decorator(login_required, name='dispatch')
 class BaseSummarizationView(SummarizationMixin, View):
     """Base view class for summarization functionality."""
 
     template_name: str = None
     system_message: str = "You are a helpful assistant that summarizes text."
+    _compiled_template = None
 
-    def get(self, request):
-        """Handle GET requests."""
-        models, selected_model = self.get_user_models(request)
-        context = self.get_base_context(models, selected_model)
-        return render(request, self.template_name, context)
+    @classmethod
+    def get_compiled_template(cls):
+        """Load the view's template once per class instead of on every request."""
+        # Read from the class's own __dict__ so subclasses never share a template;
+        # skipped under DEBUG so template edits show up without a restart
+        template = cls.__dict__.get('_compiled_template')
+        if template is None or settings.DEBUG:
+            template = cls._compiled_template = get_template(cls.template_name)
+        return template
 
-    def post(self, request):
-        """Handle POST requests."""
-        models, selected_model = self.get_user_models(request)
-        if not models.exists():
-            context = self.get_base_context(models, None)
-            return render(request, self.template_name, context)
+    async def dispatch(self, request, *args, **kwargs):
+        """
+        Resolve the user up front and require login.
+
+        The resolved user replaces the lazy request.user, so handlers never trigger
+        a sync lookup and later attribute access is a plain instance lookup.
+        """
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await super().dispatch(request, *args, **kwargs)
+
+    def render_response(self, request, context: Dict[str, Any]) -> TemplateResponse:
+        """
+        Return a lazily rendered response for the view's template.
+
+        Django renders it after the view and middleware have run, in a worker
+        thread for async views, so decorators can still adjust context_data.
+        """
+        return TemplateResponse(request, self.get_compiled_template(), context)
+
+    def form_digest(self, request, models) -> str:
+        """Return a digest of everything the form page depends on: user, models and CSRF secret."""
+        # The CSRF secret is included so a page is never reused with a form token
+        # that no longer matches the cookie (e.g. after logging in again)
+        get_token(request)
+        key = f"{self.template_name}:{request.user.pk}:{request.META['CSRF_COOKIE']}:{','.join(models)}"
+        return hashlib.md5(key.encode()).hexdigest()
+
+    # The page is per user and carries a CSRF token: never store it in shared
+    # caches, and have browsers revalidate with the ETag before reusing it
+    @method_decorator(cache_control(private=True, no_cache=True))
+    async def get(self, request):
+        """Handle GET requests, answering 304 when the browser's copy is current."""
+        models, selected_model = await self.get_user_models(request)
+        if selected_model is None:
+            # Not cached or tagged: the page carries a one-off message
+            return self.render_response(request, self.get_base_context(models, None))
 
-        # Get form data
-        selected_model = request.POST.get('model', selected_model)
+        # The rendered page is cached under the same digest as its ETag, so a
+        # model list change gives both a new tag and a freshly rendered body
+        digest = self.form_digest(request, models)
+        etag = quote_etag(digest)
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
 
-        if not self.validate_model_access(request, models, selected_model):
-            context = self.get_base_context(models, selected_model)
-            return render(request, self.template_name, context)
+        page_key = f'summary_form:{digest}'
+        content = await cache.aget(page_key)
+        if content is not None:
+            response = HttpResponse(content)
+        else:
+            response = self.render_response(request, self.get_base_context(models, selected_model))
+            response.add_post_render_callback(
+                lambda rendered: cache.set(page_key, rendered.content, SUMMARY_FORM_CACHE_TIMEOUT)
+            )
+        response['ETag'] = etag
+        return response
+
+    def wants_stream(self, request) -> bool:
+        """Return True if the client asked for the summary as a Server-Sent Events stream."""
+        return 'text/event-stream' in request.headers.get('Accept', '')
+
+    def event_stream_response(self, events: AsyncIterator[str]) -> StreamingHttpResponse:
+        """Wrap SSE messages in a response that proxies will not buffer."""
+        response = StreamingHttpResponse(events, content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def stream_messages(self, request) -> StreamingHttpResponse:
+        """Send pending Django messages as SSE error events instead of showing them on the next page."""
+        # Read now, before the messages middleware stores unread messages
+        errors = [str(message) for message in messages.get_messages(request)]
+
+        async def events():
+            for error in errors:
+                yield sse_event({'error': error}, event='error')
+
+        return self.event_stream_response(events())
+
+    def stream_summary(self, request, selected_model: str) -> StreamingHttpResponse:
+        """Stream the summary to the client as SSE 'delta' messages followed by a 'done' event."""
+        async def events():
+            try:
+                value = self.read_input(request, selected_model)
+                async for delta in self.summarize_stream(value, selected_model):
+                    yield sse_event({'delta': delta})
+                logger.info("%s stream completed successfully for user %s", self.__class__.__name__, request.user.username)
+                yield sse_event({}, event='done')
+            except Exception as e:
+                self.handle_summarization_error(request, e, self.__class__.__name__.lower())
+                for message in messages.get_messages(request):
+                    yield sse_event({'error': str(message)}, event='error')
+
+        return self.event_stream_response(events())
+
+    async def post(self, request):
+        """Handle POST requests."""
+        streaming = self.wants_stream(request)
+        models, selected_model = await self.resolve_models(request, request.POST.get('model'))
+        if streaming:
+            if selected_model is None:
+                return self.stream_messages(request)
+            return self.stream_summary(request, selected_model)
+
+        # Built once; only the summary is filled in below
+        context = self.get_base_context(models, selected_model)
+        if selected_model is None:
+            return self.render_response(request, context)
 
         try:
             # Process the input and generate summary
-            summary = self.process_input(request, selected_model)
-            logger.info(f"{self.__class__.__name__} completed successfully for user {request.user.username}")
+            context['summary'] = await self.process_input(request, selected_model)
+            logger.info("%s completed successfully for user %s", self.__class__.__name__, request.user.username)
 
         except Exception as e:
             self.handle_summarization_error(request, e, self.__class__.__name__.lower())
-            summary = None
 
-        context = self.get_base_context(models, selected_model, summary=summary)
-        return render(request, self.template_name, context)
+        return self.render_response(request, context)
+
+    async def process_input(self, request, selected_model: str) -> str:
+        """Read the submitted input and return its summary."""
+        value = self.read_input(request, selected_model)
+        return await self.summarize(value, selected_model)
+
+    def read_input(self, request, selected_model: str) -> str:
+        """Return the validated input from the request. Override in subclasses."""
+        raise NotImplementedError("Subclasses must implement read_input method")
+
+    async def summarize(self, value: str, selected_model: str) -> str:
+        """Return the summary of the input. Override in subclasses."""
+        raise NotImplementedError("Subclasses must implement summarize method")
 
-    def process_input(self, request, selected_model: str) -> str:
-        """Process input and return summary. Override in subclasses."""
-        raise NotImplementedError("Subclasses must implement process_input method")
\ No newline at end of file
+    def summarize_stream(self, value: str, selected_model: str) -> AsyncIterator[str]:
+        """Return an async iterator over the summary as it is generated. Override in subclasses."""
+        raise NotImplementedError("Subclasses must implement summarize_stream method")
@@ -50,6 +50,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Serves static files before the rest of the stack runs
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -77,6 +79,9 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'summarizer.wsgi.application'
 
+# Served by uvicorn (see scripts/start.zsh) so async views can overlap OpenAI calls
+ASGI_APPLICATION = 'summarizer.asgi.application'
+
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
@@ -85,10 +90,35 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Persistent connections don't help under ASGI: each request's sync ORM work
+        # runs in its own thread context and connections are per thread, so a kept
+        # connection is never reused and is left open instead of closed at request
+        # end. For SQLite, opening a connection is just a file open.
+        'CONN_MAX_AGE': 0,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Set REDIS_URL to share the cache between workers (requires the redis package);
+# otherwise each process keeps its own in-memory cache.
+
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -126,6 +156,23 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# Static files are served by WhiteNoise. Outside DEBUG they come from
+# collectstatic output with hashed, precompressed names (scripts/start.zsh
+# runs collectstatic); in DEBUG they are found in the app directories.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
+# Hashed files are cached forever regardless; this covers unhashed paths
+WHITENOISE_MAX_AGE = 0 if DEBUG else 60 * 60
+
 # Media files (User uploads and generated content)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -162,18 +209,25 @@ LOGGING = {
             'class': 'logging.StreamHandler',  # Console output
             'formatter': 'simple',  # Simple format for console
         },
+        # Request threads only enqueue records; a listener thread (started in
+        # home.apps) writes them to the console and file handlers
+        'queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'handlers': ['console', 'file'],
+            'respect_handler_level': True,
+        },
     },
 
     # Root logger configuration
     'root': {
-        'handlers': ['console', 'file'],
+        'handlers': ['queue'],
         'level': 'INFO',
     },
 
     # Specific logger for Django framework
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,  # Don't pass to root logger
         },
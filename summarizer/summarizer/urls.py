@@ -33,6 +33,8 @@ urlpatterns = [
     path('', include('home.urls')),
 ]
 
-# Serve media files in development
+# Static files are served by WhiteNoise middleware. Media files (generated blog
+# posts) are served here in development only; in production the reverse proxy
+# serves MEDIA_ROOT at MEDIA_URL.
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
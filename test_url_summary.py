@@ -1,54 +1,58 @@
-#!/usr/bin/env python3
 """
-Test script to simulate URL summarization request
+Tests for the URL summarization view.
+
+Run with pytest; pytest-django loads the settings configured in pytest.ini.
+The page download and OpenAI calls are mocked, so no network access is needed.
 """
-import os
-import sys
-import django
-from django.test import Client
-from django.contrib.auth import get_user_model
-from django.test.utils import get_runner
-
-# Add the project directory to the Python path
-sys.path.insert(0, '/Users/kenny.w.philp/training/djangotest/summarizer')
-sys.path.insert(0, '/Users/kenny.w.philp/training/djangotest')
-
-# Set up Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'summarizer.settings')
-django.setup()
-
-# Now we can import Django models and use the ORM
-import importlib.util
-spec = importlib.util.spec_from_file_location("home.models", "/Users/kenny.w.philp/training/djangotest/summarizer/home/models.py")
-home_models = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(home_models)
-SupportedOpenAIModel = home_models.SupportedOpenAIModel
-from django.contrib.auth.models import User
-
-def test_url_summary():
-    # Create a test client
-    client = Client()
-
-    # Get or create a test user
-    User = get_user_model()
-    try:
-        user = User.objects.get(username='testuser')
-    except User.DoesNotExist:
-        user = User.objects.create_user(username='testuser', password='testpass')
-
-    # Get or create a test model
-    try:
-        model = SupportedOpenAIModel.objects.get(name='gpt-3.5-turbo')
-    except SupportedOpenAIModel.DoesNotExist:
-        model = SupportedOpenAIModel.objects.create(
-            name='gpt-3.5-turbo', 
-            input_cost=0.0015,  # $0.0015 per 1K tokens
-            output_cost=0.002
-        )
-        user.assigned_models.add(model)
-
-    # Log in the user
-    client.login(username='testuser', password='testpass')
+from unittest.mock import AsyncMock
+
+import pytest
+import requests
+from django.core.cache import cache
+
+from home.models import SupportedOpenAIModel
+from home.semantic_cache import semantic_cache
+from home.summarizer_service import ContentProcessor, OpenAIService
+
+PAGE_HTML = '<html><body><nav>Menu</nav><p>Article body text.</p></body></html>'
+MOCK_SUMMARY = 'A short summary of the article.'
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep cached page text and summaries from leaking between tests."""
+    cache.clear()
+    semantic_cache.clear()
+
+
+@pytest.fixture
+def user(django_user_model):
+    """A user with the default test model assigned."""
+    user = django_user_model.objects.create_user(username='testuser', password='testpass')
+    # Each test gets an empty database, so there is nothing to look up first
+    model = SupportedOpenAIModel.objects.create(
+        name='gpt-3.5-turbo',
+        input_cost=0.0015,  # $0.0015 per 1K tokens
+        output_cost=0.002,
+    )
+    user.assigned_models.add(model)
+    return user
+
+
+@pytest.fixture
+def openai_api(monkeypatch):
+    """Replace the OpenAI calls with a canned summary and no embedding."""
+    call_api = AsyncMock(return_value=MOCK_SUMMARY)
+    monkeypatch.setattr(OpenAIService, 'call_openai_api_async', call_api)
+    monkeypatch.setattr(OpenAIService, 'embed_async', AsyncMock(return_value=None))
+    return call_api
+
+
+@pytest.mark.django_db
+def test_url_summary(client, user, openai_api, monkeypatch):
+    monkeypatch.setattr(ContentProcessor, 'fetch_url_content', lambda url: PAGE_HTML)
+    # Log in the user without going through password hashing
+    client.force_login(user)
 
     # Make a POST request to the URL summary view
     response = client.post('/url-summary/', {
@@ -56,21 +60,27 @@ def test_url_summary():
         'model': 'gpt-3.5-turbo'
     })
 
-    print(f"Response status: {response.status_code}")
-    print(f"Response content length: {len(response.content)}")
+    assert response.status_code == 200
+    assert MOCK_SUMMARY.encode() in response.content
+    api_params = openai_api.call_args.args[0]
+    assert api_params['model'] == 'gpt-3.5-turbo'
+    assert 'Article body text.' in api_params['messages'][-1]['content']
+
+
+@pytest.mark.django_db
+def test_url_summary_fetch_error(client, user, openai_api, monkeypatch):
+    def fail(url):
+        raise requests.ConnectionError('connection refused')
 
-    # Check if summary is in the response
-    if b'summary =' in response.content:
-        # Extract the debug line
-        content_str = response.content.decode('utf-8')
-        start = content_str.find('<!-- Debug: summary = "')
-        if start != -1:
-            end = content_str.find('" (length:', start)
-            if end != -1:
-                summary_value = content_str[start+23:end]
-                print(f"Summary value: '{summary_value}'")
+    monkeypatch.setattr(ContentProcessor, 'fetch_url_content', fail)
+    client.force_login(user)
 
-    return response
+    response = client.post('/url-summary/', {
+        'url': 'https://www.bbc.com/news',
+        'model': 'gpt-3.5-turbo'
+    })
 
-if __name__ == '__main__':
-    test_url_summary()
\ No newline at end of file
+    assert response.status_code == 200
+    assert b'Error fetching the URL: connection refused' in response.content
+    assert MOCK_SUMMARY.encode() not in response.content
+    openai_api.assert_not_called()